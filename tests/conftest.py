@@ -9,21 +9,69 @@ This module provides fixtures for creating and managing test nodes
 
 # pylint: disable=redefined-outer-name
 
+import contextlib
 import logging
+import logging.handlers
 import os
-import time
+import queue
+import threading
 from typing import Callable, List
 
 import pytest
 from test_framework import FlorestaTestFramework
 from test_framework.constants import (
+    FLORESTA_LOG_BUFFER,
+    FLORESTA_LOG_LEVEL,
     FLORESTA_TEMP_DIR,
     WALLET_ADDRESS,
     WALLET_DESCRIPTOR_EXTERNAL,
     WALLET_DESCRIPTOR_INTERNAL,
 )
 from test_framework.node import Node, NodeType
-from test_framework.util import Utility
+from test_framework.util import Utility, get_log_file_path, get_xdist_worker
+
+# Arguments of the utreexod nodes started by the fixtures. A tuple, so the
+# nodes can share it without copying.
+_UTREEXOD_EXTRA_ARGS = (
+    f"--miningaddr={WALLET_ADDRESS}",
+    "--utreexoproofindex",
+    "--prune=0",
+)
+
+# Extra arguments of the nodes started by the fixtures, per variant
+_DEFAULT_EXTRA_ARGS = {
+    NodeType.FLORESTAD: (),
+    NodeType.BITCOIND: (),
+    NodeType.UTREEXOD: _UTREEXOD_EXTRA_ARGS,
+}
+
+
+def pytest_addoption(parser):
+    """Register the command line options used by the node fixtures."""
+    parser.addoption(
+        "--node-scope",
+        action="store",
+        default="function",
+        choices=("function", "class", "module", "package", "session"),
+        help="Scope of the node fixtures (default: function). Wider scopes reuse the "
+        "same daemons across tests, so only use them on tests that don't rely on a "
+        "fresh chain.",
+    )
+
+
+# pylint: disable=unused-argument
+def _node_scope(fixture_name, config) -> str:
+    """Dynamic scope for the node fixtures, selected with `--node-scope`."""
+    return config.getoption("--node-scope")
+
+
+def _logging_scope(fixture_name, config) -> str:
+    """
+    Dynamic scope for `setup_logging`: a log file per test module, unless the
+    node fixtures, which depend on it, live longer than a module.
+    """
+    node_scope = _node_scope(fixture_name, config)
+    return node_scope if node_scope in ("package", "session") else "module"
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -42,80 +90,281 @@ def validate_and_check_environment():
 
     # Check for required binaries
     binaries_dir = os.path.join(temp_dir, "binaries")
-    binaries = {
-        "florestad": os.path.join(binaries_dir, "florestad"),
-        "utreexod": os.path.join(binaries_dir, "utreexod"),
-        "bitcoind": os.path.join(binaries_dir, "bitcoind"),
-    }
+    if not os.path.isdir(binaries_dir):
+        pytest.fail(f"Binaries directory not found at {binaries_dir}")
+
+    # A single directory listing instead of one stat per binary
+    with os.scandir(binaries_dir) as entries:
+        present = {entry.name for entry in entries}
+
+    missing = sorted({"florestad", "utreexod", "bitcoind"} - present)
+    if missing:
+        pytest.fail(f"Binaries {', '.join(missing)} not found at {binaries_dir}")
 
-    for binary_name, binary_path in binaries.items():
-        if not os.path.exists(binary_path):
-            pytest.fail(f"{binary_name} binary not found at {binary_path}")
+
+def _item_logger(item) -> logging.Logger | None:
+    """Get the logger used by a test, if it requested one."""
+    for name in (
+        "setup_logging",
+        "shared_setup_logging",
+        "readonly_setup_logging",
+    ):
+        if name in item.funcargs:
+            return item.funcargs[name]
+    return None
 
 
 # pylint: disable=unused-argument
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    Hook that captures the test result for use in fixtures.
+    Hook that captures the test result for use in fixtures, and writes the
+    failures to the test log.
     """
     outcome = yield
     rep = outcome.get_result()
     setattr(item, f"rep_{rep.when}", rep)
 
+    if rep.when == "call" and rep.failed:
+        logger = _item_logger(item)
+        if logger is not None:
+            _log_test_failure(logger, item.name, rep)
+            # The daemons append to the same file directly, write the buffered
+            # records now so the failure shows up next to their output
+            log_router = item.funcargs.get("log_router")
+            if log_router is not None:
+                _flush_logger(logger, log_router)
+            rep.sections.append(("Log file", f"📋 {get_log_file_path(logger)}"))
+
+
+@pytest.fixture(scope="session")
+def git_describe() -> str:
+    """`git describe` of the tested tree, it names the directory of the test logs."""
+    return Utility.get_git_describe()
+
+
+@pytest.fixture(scope="session")
+def log_dir(git_describe) -> str:
+    """Directory of the test logs, created once per session."""
+    path = os.path.join(FLORESTA_TEMP_DIR, "logs", git_describe)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    `QueueHandler` putting the records in the queue as they are.
+
+    The default `prepare` formats the record on the calling thread so it can
+    be pickled, the queue here never leaves the process, so formatting for
+    the log file is left to the `_LogRouter` thread.
+
+    `target` is the handler the router forwards the records to, so
+    `_flush_logger` and the daemons can find the file behind the queue.
+    """
+
+    def __init__(self, queue_, target: logging.Handler):
+        super().__init__(queue_)
+        self.target = target
+
+    def prepare(self, record):
+        return record
+
+
+class _LogRouter(logging.Handler):
+    """
+    Write the records of the test loggers from a single background thread.
+
+    The test loggers only put their records in a queue, a `QueueListener`
+    hands them to this handler, which forwards each record to the handler
+    attached for its logger. Formatting and writing the log files are kept out
+    of the tests.
+
+    The test loggers still propagate, so pytest's capture and live-log
+    handlers (e.g. with `--log-cli-level`) keep formatting their records on
+    the test thread; only the work for the log files is moved here.
+    """
+
+    DRAIN_TIMEOUT = 10  # seconds
+
+    def __init__(self):
+        super().__init__()
+        self.queue = queue.SimpleQueue()
+        self._targets = {}
+        self._listener = logging.handlers.QueueListener(self.queue, self)
+
+    def start(self):
+        """Start the background thread."""
+        self._listener.start()
+
+    def stop(self):
+        """
+        Write the pending records, stop the background thread and close
+        the handlers of every test logger.
+        """
+        self._listener.stop()
+
+        for handler in self._targets.values():
+            # Close the whole chain: memory buffer -> file
+            while handler is not None:
+                target = getattr(handler, "target", None)
+                handler.close()
+                handler = target
+
+    def attach(self, logger: logging.Logger, target: logging.Handler):
+        """Send the records of `logger` to `target` through the queue."""
+        self._targets[logger.name] = target
+        logger.addHandler(_RecordQueueHandler(self.queue, target))
+
+    def drain(self):
+        """Wait until every record queued so far has been handed to its target."""
+        event = threading.Event()
+        self.queue.put(logging.makeLogRecord({"drain_event": event}))
+        event.wait(timeout=self.DRAIN_TIMEOUT)
+
+    def emit(self, record):
+        event = getattr(record, "drain_event", None)
+        if event is not None:
+            event.set()
+            return
+
+        target = self._targets.get(record.name)
+        if target is not None:
+            target.handle(record)
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    `FileHandler` writing through a large stream buffer.
+
+    `StreamHandler.emit` flushes the stream after every record, this handler
+    only writes it, so the records reach the file in `BUFFER_SIZE` chunks or
+    when the handler is flushed (see `_flush_logger`) or closed.
+    """
 
-def _create_logger(test_name):
+    BUFFER_SIZE = 65536  # bytes
+
+    def _open(self):
+        # pylint: disable=consider-using-with
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record):
+        if self.stream is None:
+            if self.mode != "w" or not self._closed:
+                self.stream = self._open()
+        if self.stream is None:
+            return
+
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.handleError(record)
+
+
+@pytest.fixture(scope="session")
+def log_router():
+    """Single background thread writing the test logs for the whole session."""
+    router = _LogRouter()
+    router.start()
+
+    yield router
+
+    router.stop()
+
+
+def _create_logger(test_name, log_dir, log_router):
     """Create a logger with a file handler for the given test name.
 
     Shared helper used by both function-scoped and class-scoped logging
-    fixtures to avoid duplicating the setup logic.
+    fixtures to avoid duplicating the setup logic. Records are written by
+    the `log_router` thread and buffered in memory, so they reach the file in
+    batches, or as soon as an error is logged.
+
+    The handlers are created once per logger and kept for the whole session
+    (the `log_router` closes them), so a test running again under the same
+    name reuses the already opened file.
     """
     logger = logging.getLogger(test_name)
+    logger.setLevel(FLORESTA_LOG_LEVEL)
 
-    formatter = logging.Formatter(
-        "%(asctime)s - %(levelname)s - %(pathname)s:%(lineno)d - %(message)s"
-    )
-
-    git_describe = Utility.get_git_describe()
-    log_file = os.path.join(FLORESTA_TEMP_DIR, "logs", git_describe, f"{test_name}.log")
-    os.makedirs(os.path.dirname(log_file), exist_ok=True)
-    file_handler = logging.FileHandler(log_file, mode="w")
-    file_handler.setFormatter(formatter)
+    log_file = os.path.join(log_dir, f"{test_name}.log")
 
     if not logger.handlers:
-        logger.addHandler(file_handler)
+        # Drop the log of a previous run. The file is then opened in append
+        # mode on the first write, since the daemons may have written to it already.
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(log_file)
+
+        file_handler = _BufferedFileHandler(log_file, mode="a", delay=True)
+        file_handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s - %(levelname)s - %(pathname)s:%(lineno)d - %(message)s"
+            )
+        )
+        memory_handler = logging.handlers.MemoryHandler(
+            capacity=FLORESTA_LOG_BUFFER,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+        )
+        log_router.attach(logger, memory_handler)
 
     return logger, log_file
 
 
-@pytest.fixture(scope="function")
-def setup_logging(request):
+def _log_test_failure(logger, test_name, report=None):
+    """Write a failure banner, and the failure report if any, to the test logger."""
+    logger.error("=" * 80)
+    logger.error("TEST FAILED: %s", test_name)
+    logger.error("=" * 80)
+    if report is not None:
+        logger.error("%s", report.longrepr)
+        logger.error("=" * 80)
+
+
+def _flush_logger(logger, log_router):
+    """Write the queued and buffered records of the logger to its log file."""
+    log_router.drain()
+
+    for handler in logger.handlers:
+        # Flush the whole chain: queue -> memory buffer -> file
+        while handler is not None:
+            handler.flush()
+            handler = getattr(handler, "target", None)
+
+
+@pytest.fixture(scope=_logging_scope)
+def setup_logging(request, log_dir, log_router):
     """
-    Configure logging for the test, including the file and line number where the log was called.
+    Configure logging for the tests of a module, including the file and line number
+    where the log was called. All the tests of the module, and the daemons they
+    start, write to the same `<module>.log` file.
+
+    Failures are written to the log by `pytest_runtest_makereport`.
     """
-    test_name = request.node.name
-    logger, log_file = _create_logger(test_name)
+    # A session-scoped request has no node name, and every xdist worker has one
+    log_name = os.path.splitext(request.node.name)[0] or "-".join(
+        filter(None, (request.scope, get_xdist_worker()))
+    )
+    logger, _log_file = _create_logger(log_name, log_dir, log_router)
 
     yield logger
 
-    # Capture test result and log it
-    if hasattr(request.node, "rep_call") and request.node.rep_call.failed:
-        logger.error("=" * 80)
-        logger.error("TEST FAILED: %s", test_name)
-        logger.error("=" * 80)
-        logger.error("%s", request.node.rep_call.longrepr)
-        logger.error("=" * 80)
-
-        print(f"📋 Log file: {log_file}\n")
+    # Flush the handlers after the tests, they are closed at the end of the session
+    _flush_logger(logger, log_router)
 
-    # Clear handlers after the test
-    logger.handlers.clear()
 
-
-@pytest.fixture(scope="function")
+@pytest.fixture(scope=_node_scope)
 def node_manager(setup_logging, request):
     """Provides a FlorestaTestFramework instance that automatically cleans up after each test"""
-    manager = FlorestaTestFramework(logger=setup_logging, test_name=request.node.name)
+    manager = FlorestaTestFramework(
+        logger=setup_logging, test_name=request.node.name or request.scope
+    )
 
     yield manager
 
@@ -123,66 +372,153 @@ def node_manager(setup_logging, request):
     manager.stop()
 
 
-@pytest.fixture
+def _add_node(manager: FlorestaTestFramework, variant: NodeType) -> Node:
+    """Create, without starting it, a node of the given variant for the fixtures."""
+    return manager.add_node_extra_args(
+        variant=variant, extra_args=_DEFAULT_EXTRA_ARGS[variant]
+    )
+
+
+def _start_node(manager: FlorestaTestFramework, variant: NodeType) -> Node:
+    """Create and start a node of the given variant with the fixtures' configuration."""
+    node = _add_node(manager, variant)
+    manager.run_node(node)
+    return node
+
+
+def _start_nodes(
+    manager: FlorestaTestFramework, *variants: NodeType
+) -> tuple[Node, ...]:
+    """Create one node per given variant and start all of them in parallel."""
+    nodes = tuple(_add_node(manager, variant) for variant in variants)
+    manager.run_nodes(nodes)
+    return nodes
+
+
+@pytest.fixture(scope=_node_scope)
 def florestad_node(node_manager) -> Node:
     """Single `florestad` node with default configurations, started and ready for testing"""
-    node = node_manager.add_node_default_args(variant=NodeType.FLORESTAD)
-    node_manager.run_node(node)
-    return node
+    return _start_node(node_manager, NodeType.FLORESTAD)
 
 
-@pytest.fixture
+@pytest.fixture(scope=_node_scope)
+def genesis_blockchain_info(florestad_node) -> dict:
+    """
+    `getblockchaininfo` response of `florestad_node` at genesis, as returned
+    when the node was started. Reused instead of querying the node again.
+    """
+    return florestad_node.startup_blockchain_info
+
+
+@pytest.fixture(scope=_node_scope)
 def bitcoind_node(node_manager) -> Node:
     """Single `bitcoind` node with default configurations, started and ready for testing"""
-    node = node_manager.add_node_default_args(variant=NodeType.BITCOIND)
-    node_manager.run_node(node)
-    return node
+    return _start_node(node_manager, NodeType.BITCOIND)
 
 
-@pytest.fixture
+@pytest.fixture(scope=_node_scope)
 def utreexod_node(node_manager) -> Node:
     """Single `utreexod` node with default configurations, started and ready for testing"""
-    node = node_manager.add_node_extra_args(
-        variant=NodeType.UTREEXOD,
-        extra_args=[
-            f"--miningaddr={WALLET_ADDRESS}",
-            "--utreexoproofindex",
-            "--prune=0",
-        ],
-    )
-    node_manager.run_node(node)
-    return node
+    return _start_node(node_manager, NodeType.UTREEXOD)
 
 
 @pytest.fixture
-def florestad_utreexod(
-    florestad_node, utreexod_node, node_manager
-) -> tuple[Node, Node]:
+def started_nodes(node_manager) -> Callable[..., tuple[Node, ...]]:
+    """
+    Factory fixture that creates one node per given variant, with the default
+    fixtures' configuration, and starts all of them in parallel.
+    """
+
+    def _create_nodes(*variants: NodeType) -> tuple[Node, ...]:
+        return _start_nodes(node_manager, *variants)
+
+    return _create_nodes
+
+
+@pytest.fixture(scope=_node_scope)
+def florestad_utreexod(node_manager) -> tuple[Node, Node]:
     """
     Creates and starts a `florestad` node and a `utreexod` node.
     The nodes are automatically connected to each other and are ready for testing.
     """
-    node_manager.connect_nodes(florestad_node, utreexod_node)
+    florestad, utreexod = _start_nodes(
+        node_manager, NodeType.FLORESTAD, NodeType.UTREEXOD
+    )
+    node_manager.connect_nodes(florestad, utreexod)
 
-    return florestad_node, utreexod_node
+    return florestad, utreexod
 
 
-@pytest.fixture
-def florestad_bitcoind(
-    florestad_node, bitcoind_node, node_manager
-) -> tuple[Node, Node]:
+@pytest.fixture(scope=_node_scope)
+def florestad_bitcoind(node_manager) -> tuple[Node, Node]:
     """
     Creates and starts a `florestad` node and a `bitcoind` node.
     The nodes are automatically connected to each other and are ready for testing.
     """
-    node_manager.connect_nodes(florestad_node, bitcoind_node)
+    florestad, bitcoind = _start_nodes(
+        node_manager, NodeType.FLORESTAD, NodeType.BITCOIND
+    )
+    node_manager.connect_nodes(florestad, bitcoind)
+
+    return florestad, bitcoind
+
 
-    return florestad_node, bitcoind_node
+@pytest.fixture(scope=_node_scope)
+def florestad_bitcoind_utreexod(node_manager) -> tuple[Node, Node, Node]:
+    """
+    Creates and starts, in parallel, a `florestad`, a `bitcoind` and a `utreexod` node.
+    The nodes are not connected to each other.
+    """
+    return _start_nodes(
+        node_manager, NodeType.FLORESTAD, NodeType.BITCOIND, NodeType.UTREEXOD
+    )
+
+
+def _setup_chain(
+    manager: FlorestaTestFramework,
+    nodes: tuple[Node, Node, Node],
+    blocks: int,
+    floresta_descriptors: List[str] | None,
+    addr_coinbase: str | None = None,
+) -> tuple[Node, Node, Node]:
+    """
+    Load the wallet descriptors on florestad, mine `blocks` blocks, connect
+    the (florestad, bitcoind, utreexod) nodes to each other and wait until
+    all of them are at the mined tip.
+    """
+    florestad, bitcoind, utreexod = nodes
+    if floresta_descriptors is None:
+        floresta_descriptors = [
+            WALLET_DESCRIPTOR_EXTERNAL,
+            WALLET_DESCRIPTOR_INTERNAL,
+        ]
+
+    for descriptor in floresta_descriptors:
+        florestad.rpc.load_descriptor(descriptor)
+
+    if addr_coinbase:
+        bitcoind.rpc.generate_block_to_address(blocks, addr_coinbase)
+        miner, peer = bitcoind, utreexod
+    else:
+        utreexod.rpc.generate(blocks)
+        miner, peer = utreexod, bitcoind
+
+    manager.connect_nodes_parallel(
+        [(florestad, utreexod), (bitcoind, utreexod), (florestad, bitcoind)]
+    )
+
+    # The connections are made at the same time, in no particular order, so
+    # wait for the mined chain to reach every node before handing them over
+    tip = miner.rpc.get_block_count()
+    for node in (florestad, peer):
+        manager.wait_for_tip(node, tip)
+
+    return florestad, bitcoind, utreexod
 
 
 @pytest.fixture
 def florestad_bitcoind_utreexod_with_chain(
-    florestad_node, bitcoind_node, utreexod_node, node_manager
+    florestad_bitcoind_utreexod, node_manager
 ) -> Callable[..., tuple[Node, Node, Node]]:
     """
     Factory fixture that initializes a three-node network with a populated blockchain.
@@ -197,36 +533,20 @@ def florestad_bitcoind_utreexod_with_chain(
         floresta_descriptors: List[str] | None = None,
         addr_coinbase: str | None = None,
     ) -> tuple[Node, Node, Node]:
-        if floresta_descriptors is None:
-            floresta_descriptors = [
-                WALLET_DESCRIPTOR_EXTERNAL,
-                WALLET_DESCRIPTOR_INTERNAL,
-            ]
-
-        for descriptor in floresta_descriptors:
-            florestad_node.rpc.load_descriptor(descriptor)
-
-        if addr_coinbase:
-            bitcoind_node.rpc.generatetoaddress(blocks, addr_coinbase)
-        else:
-            utreexod_node.rpc.generate(blocks)
-
-        node_manager.connect_nodes(florestad_node, utreexod_node)
-        time.sleep(3)
-        node_manager.connect_nodes(bitcoind_node, utreexod_node)
-        time.sleep(1)
-        node_manager.connect_nodes(florestad_node, bitcoind_node)
-
-        return florestad_node, bitcoind_node, utreexod_node
+        return _setup_chain(
+            node_manager,
+            florestad_bitcoind_utreexod,
+            blocks,
+            floresta_descriptors,
+            addr_coinbase,
+        )
 
     return _create_nodes_with_chain
 
 
 @pytest.fixture(scope="class")
 def shared_florestad_bitcoind_utreexod_with_chain(
-    shared_florestad_node,
-    shared_bitcoind_node,
-    shared_utreexod_node,
+    shared_florestad_bitcoind_utreexod,
     shared_node_manager,
 ) -> Callable[..., tuple[Node, Node, Node]]:
     """
@@ -240,26 +560,15 @@ def shared_florestad_bitcoind_utreexod_with_chain(
         blocks: int = 100,
         floresta_descriptors: List[str] | None = None,
     ) -> tuple[Node, Node, Node]:
-        if floresta_descriptors is None:
-            floresta_descriptors = [
-                WALLET_DESCRIPTOR_EXTERNAL,
-                WALLET_DESCRIPTOR_INTERNAL,
-            ]
-
-        for descriptor in floresta_descriptors:
-            shared_florestad_node.rpc.load_descriptor(descriptor)
-
-        shared_utreexod_node.rpc.generate(blocks)
-
-        shared_node_manager.connect_nodes(shared_florestad_node, shared_utreexod_node)
-        time.sleep(3)
-        shared_node_manager.connect_nodes(shared_bitcoind_node, shared_utreexod_node)
-        time.sleep(1)
-        shared_node_manager.connect_nodes(shared_florestad_node, shared_bitcoind_node)
-
+        nodes = _setup_chain(
+            shared_node_manager,
+            shared_florestad_bitcoind_utreexod,
+            blocks,
+            floresta_descriptors,
+        )
         shared_node_manager.wait_for_sync_nodes(is_finished_ibd=False)
 
-        return shared_florestad_node, shared_bitcoind_node, shared_utreexod_node
+        return nodes
 
     return _create_nodes_with_chain
 
@@ -269,7 +578,7 @@ def add_node_with_tls(node_manager):
     """Creates and starts a node with TLS enabled, based on the specified variant."""
 
     def _create_node(variant: NodeType) -> Node:
-        if variant == NodeType.BITCOIND:
+        if variant is NodeType.BITCOIND:
             raise ValueError("BITCOIND does not support TLS")
 
         node = node_manager.add_node_with_tls(
@@ -282,19 +591,14 @@ def add_node_with_tls(node_manager):
 
 
 @pytest.fixture(scope="class")
-def shared_setup_logging(request):
+def shared_setup_logging(request, log_dir, log_router):
     """Class-scoped logging fixture for tests that share a single node."""
     test_name = request.node.name
-    logger, _log_file = _create_logger(test_name)
+    logger, _log_file = _create_logger(test_name, log_dir, log_router)
 
     yield logger
 
-    if hasattr(request.node, "rep_call") and request.node.rep_call.failed:
-        logger.error("=" * 80)
-        logger.error("TEST FAILED: %s", test_name)
-        logger.error("=" * 80)
-
-    logger.handlers.clear()
+    _flush_logger(logger, log_router)
 
 
 @pytest.fixture(scope="class")
@@ -310,32 +614,56 @@ def shared_node_manager(shared_setup_logging, request):
 @pytest.fixture(scope="class")
 def shared_florestad_node(shared_node_manager) -> Node:
     """Single florestad node shared across all methods in a test class."""
-    node = shared_node_manager.add_node_default_args(variant=NodeType.FLORESTAD)
-    shared_node_manager.run_node(node)
-    return node
+    return _start_node(shared_node_manager, NodeType.FLORESTAD)
 
 
 @pytest.fixture(scope="class")
 def shared_bitcoind_node(shared_node_manager) -> Node:
     """Single bitcoind node shared across all methods in a test class."""
-    node = shared_node_manager.add_node_default_args(variant=NodeType.BITCOIND)
-    shared_node_manager.run_node(node)
-    return node
+    return _start_node(shared_node_manager, NodeType.BITCOIND)
 
 
 @pytest.fixture(scope="class")
 def shared_utreexod_node(shared_node_manager) -> Node:
     """Single utreexod node shared across all methods in a test class."""
-    node = shared_node_manager.add_node_extra_args(
-        variant=NodeType.UTREEXOD,
-        extra_args=[
-            f"--miningaddr={WALLET_ADDRESS}",
-            "--utreexoproofindex",
-            "--prune=0",
-        ],
+    return _start_node(shared_node_manager, NodeType.UTREEXOD)
+
+
+@pytest.fixture(scope="class")
+def shared_florestad_bitcoind_utreexod(shared_node_manager) -> tuple[Node, Node, Node]:
+    """Class-scoped variant of ``florestad_bitcoind_utreexod``."""
+    return _start_nodes(
+        shared_node_manager, NodeType.FLORESTAD, NodeType.BITCOIND, NodeType.UTREEXOD
     )
-    shared_node_manager.run_node(node)
-    return node
+
+
+@pytest.fixture(scope="session")
+def readonly_setup_logging(log_dir, log_router):
+    """Session-scoped logger of the nodes shared by the read-only tests."""
+    log_name = "-".join(filter(None, ("readonly", get_xdist_worker())))
+    logger, _log_file = _create_logger(log_name, log_dir, log_router)
+
+    yield logger
+
+    _flush_logger(logger, log_router)
+
+
+@pytest.fixture(scope="session")
+def readonly_node_manager(readonly_setup_logging):
+    """Session-scoped node manager of the nodes shared by the read-only tests."""
+    manager = FlorestaTestFramework(logger=readonly_setup_logging, test_name="readonly")
+    yield manager
+    manager.stop()
+
+
+@pytest.fixture(scope="session")
+def florestad_node_readonly(readonly_node_manager) -> Node:
+    """
+    A florestad started once per session (once per xdist worker) for the tests
+    that only read its state. Tests that mine, load descriptors, connect peers
+    or stop the node must keep using ``florestad_node``.
+    """
+    return _start_node(readonly_node_manager, NodeType.FLORESTAD)
 
 
 @pytest.fixture
@@ -10,6 +10,8 @@ This file shows:
 - How to use pytest fixtures provided by tests/conftest.py (for example `florestad_node`)
   to create, configure and teardown a node instance.
 - How to call RPC methods via `node.rpc` and assert returned values.
+- How to reuse the node state captured at startup (`genesis_blockchain_info`)
+  instead of issuing the same RPC call again.
 """
 
 import pytest
@@ -22,13 +24,13 @@ from test_framework.constants import (
 
 
 @pytest.mark.example
-def test_functional(florestad_node):
+def test_functional(genesis_blockchain_info):
     """
     This test demonstrates how to set up and run a `florestad_node`
     and verifies that the blockchain information returned by the node's RPC
     matches the expected values for the genesis block.
     """
-    response = florestad_node.rpc.get_blockchain_info()
+    response = genesis_blockchain_info
 
     assert response["blocks"] == GENESIS_BLOCK_HEIGHT
     assert response["bestblockhash"] == GENESIS_BLOCK_HASH
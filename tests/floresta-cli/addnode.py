@@ -7,30 +7,34 @@ import pytest
 from test_framework.node import NodeType
 
 
+# pylint: disable=too-few-public-methods
 @pytest.mark.rpc
-def test_add_node_v1(
-    setup_logging, node_manager, florestad_node, add_node_with_extra_args
-):
-    """Test addnode behavior using v1 transport."""
-    log = setup_logging
-    bitcoind = add_node_with_extra_args(NodeType.BITCOIND, ["-v2transport=0"])
-    is_v2 = False
-
-    test_node = AddNodeTest(log, node_manager, florestad_node, bitcoind, is_v2)
-    test_node.run_test()
-
-
-@pytest.mark.rpc
-def test_add_node_v2(
-    setup_logging, node_manager, florestad_node, add_node_with_extra_args
-):
-    """Test addnode behavior using v2 transport."""
-    log = setup_logging
-    bitcoind = add_node_with_extra_args(NodeType.BITCOIND, ["-v2transport=1"])
-    is_v2 = True
+class TestAddNode:
+    """
+    Run the addnode workflow for both transports against the same florestad,
+    each one with its own bitcoind peer. The shared_* fixtures are class
+    scoped, so the florestad is started once for the whole class.
+    """
+
+    @pytest.mark.parametrize("is_v2", [False, True], ids=["v1", "v2"])
+    def test_add_node(
+        self, shared_setup_logging, shared_node_manager, shared_florestad_node, is_v2
+    ):
+        """Test addnode behavior using the v1 or the v2 transport."""
+        log = shared_setup_logging
+        bitcoind = shared_node_manager.add_node_extra_args(
+            variant=NodeType.BITCOIND, extra_args=[f"-v2transport={int(is_v2)}"]
+        )
+        shared_node_manager.run_node(bitcoind)
 
-    test_node = AddNodeTest(log, node_manager, florestad_node, bitcoind, is_v2)
-    test_node.run_test()
+        test_node = AddNodeTest(
+            log, shared_node_manager, shared_florestad_node, bitcoind, is_v2
+        )
+        try:
+            test_node.run_test()
+        finally:
+            # The next transport uses a fresh bitcoind, don't let this one linger
+            bitcoind.stop()
 
 
 class AddNodeTest:
@@ -53,19 +57,17 @@ class AddNodeTest:
         self.log.info(
             f"Checking if bitcoind is {'connected' if is_connected else 'disconnected'}"
         )
-        self.node_manager.wait_for_peers_connections(
+        peer_info, bitcoin_peers = self.node_manager.wait_for_peers_connections(
             self.florestad, self.bitcoind, is_connected
         )
 
         expected_peer_count = 1 if is_connected else 0
-        peer_info = self.florestad.rpc.get_peerinfo()
         assert len(peer_info) == expected_peer_count
 
         if is_connected:
             assert peer_info[0]["transport_protocol"] == ("V2" if self.is_v2 else "V1")
 
         if self.bitcoind.daemon.is_running:
-            bitcoin_peers = self.bitcoind.rpc.get_peerinfo()
             assert len(bitcoin_peers) == expected_peer_count
 
     def floresta_addnode_with_command(self, command: str):
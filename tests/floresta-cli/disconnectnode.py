@@ -8,9 +8,9 @@ Functional test for the `disconnectnode` RPC.
 See the RPC documentation at https://bitcoincore.org/en/doc/29.0.0/rpc/network/disconnectnode/
 """
 
-from time import sleep
 import pytest
 from requests.exceptions import HTTPError
+from test_framework.util import wait_until
 
 
 @pytest.mark.rpc
@@ -44,18 +44,16 @@ class DisconnectNodeTest:
         self.log.info(
             f"Checking if bitcoind is {'connected' if is_connected else 'disconnected'}"
         )
-        self.node_manager.wait_for_peers_connections(
-            self.bitcoind, self.florestad, is_connected
+        bitcoin_peers, florestad_peer_info = (
+            self.node_manager.wait_for_peers_connections(
+                self.bitcoind, self.florestad, is_connected
+            )
         )
 
         expected_peer_count = 1 if is_connected else 0
-
-        florestad_peer_info = self.florestad.rpc.get_peerinfo()
         assert len(florestad_peer_info) == expected_peer_count
 
         if self.bitcoind.daemon.is_running:
-            bitcoin_peers = self.bitcoind.rpc.get_peerinfo()
-
             assert len(bitcoin_peers) == expected_peer_count
 
     def floresta_cli_addnode(self):
@@ -137,21 +135,16 @@ class DisconnectNodeTest:
         assert res is None
         self.check_peer_connection_state(is_connected=False)
 
-        # Connect to `bitcoind` again with retry logic.
+        # Connect to `bitcoind` again, the old connection may take a moment to go away
         self.floresta_cli_addnode()
-        max_retries = 20
-        for retry in range(max_retries):
-            try:
-                self.check_peer_connection_state(is_connected=True)
-                break
-            except AssertionError as e:
-                if retry == max_retries - 1:
-                    self.log.error(
-                        f"Peer connection state check failed on retry {retry + 1}: {e}"
-                    )
-                    self.log(f"Failed to reconnect after {max_retries} attempts")
-                    raise
-                sleep(1)
+        wait_until(
+            lambda: len(self.florestad.rpc.get_peerinfo()) == 1
+            and len(self.bitcoind.rpc.get_peerinfo()) == 1,
+            timeout=20,
+            interval=0.1,
+            error_msg="bitcoind did not reconnect to florestad",
+        )
+        self.check_peer_connection_state(is_connected=True)
 
         self.log.info("===== Attempting to disconnect the peer with a valid node_id")
         # Call `disconnectnode` with a valid `node_id`)
@@ -25,7 +25,7 @@ def test_get_best_block_hash(node_manager, florestad_utreexod):
 
     utreexod.rpc.generate(10)
 
-    node_manager.wait_for_sync_nodes(is_finished_ibd=False)
+    node_manager.wait_for_tip(florestad, 10)
 
     utreexo_chain = utreexod.rpc.get_blockchain_info()
     floresta_best_block = florestad.rpc.get_bestblockhash()
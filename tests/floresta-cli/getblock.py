@@ -10,7 +10,8 @@ import time
 import random
 from typing import Any
 import pytest
-from test_framework.util import compare_fields
+from test_framework.node import NodeType
+from test_framework.util import compare_fields, run_concurrently
 
 
 class TestGetBlock:
@@ -23,15 +24,14 @@ class TestGetBlock:
     node_manager: Any = None
 
     @pytest.mark.rpc
-    def test_get_block(
-        self, florestad_node, bitcoind_node, setup_logging, node_manager
-    ):
+    def test_get_block(self, started_nodes, setup_logging, node_manager):
         """
         Test the getblock RPC command. Verifies that Florestad's getblock RPC responses are
         compliant with Bitcoin Core's getblock behavior and values.
         """
-        self.florestad = florestad_node
-        self.bitcoind = bitcoind_node
+        self.florestad, self.bitcoind = started_nodes(
+            NodeType.FLORESTAD, NodeType.BITCOIND
+        )
         self.log = setup_logging
         self.node_manager = node_manager
 
@@ -43,7 +43,7 @@ class TestGetBlock:
 
         block_count = self.bitcoind.rpc.get_block_count()
 
-        self.node_manager.wait_for_sync_nodes(is_finished_ibd=False)
+        self.node_manager.wait_for_tip(self.florestad, block_count)
 
         self.log.info("Testing getblock RPC in the genesis block")
         self.compare_block(0)
@@ -61,16 +61,22 @@ class TestGetBlock:
         verbosity levels.
         """
         block_hash = self.bitcoind.rpc.get_blockhash(height)
-        self.log.info(f"Comparing block {block_hash} between florestad and bitcoind")
+        self.log.info("Comparing block %s between florestad and bitcoind", block_hash)
 
         self.log.info("Fetching request with verbosity 0")
-        floresta_block = self.florestad.rpc.get_block(block_hash, 0)
-        bitcoind_block = self.bitcoind.rpc.get_block(block_hash, 0)
+        floresta_block, bitcoind_block = run_concurrently(
+            lambda: self.florestad.rpc.get_block(block_hash, 0),
+            lambda: self.bitcoind.rpc.get_block(block_hash, 0),
+        )
+        # A cheap check first, that also gives a readable failure for large blocks
+        assert len(floresta_block) == len(bitcoind_block), "Block hex size mismatch"
         assert floresta_block == bitcoind_block
 
         self.log.info("Fetching request with verbosity 1")
-        floresta_block = self.florestad.rpc.get_block(block_hash, 1)
-        bitcoind_block = self.bitcoind.rpc.get_block(block_hash, 1)
+        floresta_block, bitcoind_block = run_concurrently(
+            lambda: self.florestad.rpc.get_block(block_hash, 1),
+            lambda: self.bitcoind.rpc.get_block(block_hash, 1),
+        )
 
         compare_fields(
             floresta_block,
@@ -27,7 +27,7 @@ def test_get_block_count(florestad_utreexod, node_manager):
     # Mine blocks with utreexod
     utreexod.rpc.generate(MINE_BLOCKS)
 
-    node_manager.wait_for_sync_nodes(is_finished_ibd=False)
+    node_manager.wait_for_tip(florestad, MINE_BLOCKS)
 
     # Get final block counts
     final_florestad_count = florestad.rpc.get_block_count()
@@ -30,8 +30,19 @@ def test_get_block_hash(florestad_utreexod, node_manager):
     utreexod.rpc.generate(MINED_BLOCKS)
     node_manager.wait_for_sync_nodes(is_finished_ibd=False)
 
-    # Get final block hashes
-    final_florestad_hash = florestad.rpc.get_blockhash(MINED_BLOCKS)
-    final_utreexod_hash = utreexod.rpc.get_blockhash(MINED_BLOCKS)
-
-    assert final_florestad_hash == final_utreexod_hash
+    # Get the block hashes of every height
+    calls = [("getblockhash", [height]) for height in range(MINED_BLOCKS + 1)]
+    florestad_hashes = florestad.rpc.batch(calls)
+    utreexod_hashes = utreexod.rpc.batch(calls)
+
+    mismatches = [
+        (height, florestad_hash, utreexod_hash)
+        for height, (florestad_hash, utreexod_hash) in enumerate(
+            zip(florestad_hashes, utreexod_hashes)
+        )
+        if florestad_hash != utreexod_hash
+    ]
+    assert len(florestad_hashes) == len(utreexod_hashes) == MINED_BLOCKS + 1
+    assert (
+        not mismatches
+    ), f"Block hashes differ (height, florestad, utreexod): {mismatches}"
@@ -11,7 +11,13 @@ import random
 from typing import Any
 import pytest
 from requests.exceptions import HTTPError
-from test_framework.util import compare_fields
+from test_framework.constants import (
+    GENESIS_BLOCK_HASH,
+    GENESIS_BLOCK_HEADER_HEX,
+    GENESIS_HEADER,
+)
+from test_framework.node import NodeType
+from test_framework.util import compare_fields, run_concurrently, wait_until
 
 TIMEOUT_SECONDS = 20
 
@@ -26,17 +32,16 @@ class TestGetBlockheader:
     node_manager: Any = None
 
     @pytest.mark.rpc
-    def test_get_blockheader(
-        self, setup_logging, node_manager, florestad_node, bitcoind_node
-    ):
+    def test_get_blockheader(self, setup_logging, node_manager, started_nodes):
         """
         Test the getblockheader RPC command. Verifies that Florestad's getblockheader RPC responses
         are compliant with Bitcoin Core's getblockheader behavior and values.
         """
         self.log = setup_logging
         self.node_manager = node_manager
-        self.florestad = florestad_node
-        self.bitcoind = bitcoind_node
+        self.florestad, self.bitcoind = started_nodes(
+            NodeType.FLORESTAD, NodeType.BITCOIND
+        )
 
         self.log.info("Testing getblockheader with non-existent hash")
 
@@ -63,17 +68,14 @@ class TestGetBlockheader:
         self.node_manager.connect_nodes(self.florestad, self.bitcoind)
 
         block_count = self.bitcoind.rpc.get_block_count()
-        start = time.time()
-        while time.time() - start < TIMEOUT_SECONDS:
-            florestad_count = self.florestad.rpc.get_block_count()
-            if florestad_count == block_count:
-                break
-            time.sleep(0.5)
-
-        assert florestad_count == block_count
+        wait_until(
+            lambda: self.florestad.rpc.get_block_count() == block_count,
+            timeout=TIMEOUT_SECONDS,
+            error_msg=f"florestad did not reach height {block_count}",
+        )
 
         self.log.info("Testing getblockheader RPC in the genesis block")
-        self.validate_block_header(0)
+        self.validate_genesis_header()
 
         random_block = random.randint(1, block_count)
         self.log.info(f"Testing getblockheader RPC in block {random_block}")
@@ -82,6 +84,20 @@ class TestGetBlockheader:
         self.log.info(f"Testing getblockheader RPC in block {block_count}")
         self.validate_block_header(block_count)
 
+    def validate_genesis_header(self):
+        """
+        Compare the genesis block header of Florestad with the known regtest values,
+        without asking Bitcoin Core for it.
+        """
+        calls = [
+            ("getblockheader", [GENESIS_BLOCK_HASH, False]),
+            ("getblockheader", [GENESIS_BLOCK_HASH, True]),
+        ]
+        raw_header, verbose_header = self.florestad.rpc.batch(calls)
+
+        assert raw_header == GENESIS_BLOCK_HEADER_HEX
+        compare_fields(verbose_header, GENESIS_HEADER)
+
     def validate_block_header(self, height: int):
         """
         Compare a block header at given height between Florestad and Bitcoin Core for several
@@ -89,23 +105,25 @@ class TestGetBlockheader:
         """
         block_hash = self.bitcoind.rpc.get_blockhash(height)
         self.log.info(
-            f"Comparing block header {block_hash} between florestad and bitcoind"
+            "Comparing block header %s between florestad and bitcoind", block_hash
         )
 
-        self.log.info("Fetching request without verbosity")
-        florestad_header = self.florestad.rpc.get_blockheader(block_hash)
-        bitcoind_header = self.bitcoind.rpc.get_blockheader(block_hash)
-        compare_fields(florestad_header, bitcoind_header)
+        # Without verbosity, verbosity False and verbosity True
+        calls = [
+            ("getblockheader", [block_hash]),
+            ("getblockheader", [block_hash, False]),
+            ("getblockheader", [block_hash, True]),
+        ]
+        florestad_headers, bitcoind_headers = run_concurrently(
+            lambda: self.florestad.rpc.batch(calls),
+            lambda: self.bitcoind.rpc.batch(calls),
+        )
 
-        verbosity = False
-        self.log.info(f"Fetching request with verbosity {verbosity}")
-        florestad_header = self.florestad.rpc.get_blockheader(block_hash, verbosity)
-        bitcoind_header = self.bitcoind.rpc.get_blockheader(block_hash, verbosity)
-        assert florestad_header == bitcoind_header
+        self.log.info("Comparing request without verbosity")
+        compare_fields(florestad_headers[0], bitcoind_headers[0])
 
-        verbosity = True
-        self.log.info(f"Fetching request with verbosity {verbosity}")
-        florestad_header = self.florestad.rpc.get_blockheader(block_hash, verbosity)
-        bitcoind_header = self.bitcoind.rpc.get_blockheader(block_hash, verbosity)
+        self.log.info("Comparing request with verbosity False")
+        assert florestad_headers[1] == bitcoind_headers[1]
 
-        compare_fields(florestad_header, bitcoind_header)
+        self.log.info("Comparing request with verbosity True")
+        compare_fields(florestad_headers[2], bitcoind_headers[2])
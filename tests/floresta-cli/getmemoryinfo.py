@@ -10,9 +10,24 @@ import sys
 import re
 import pytest
 
+MALLOC_INFO_PATTERN = re.compile(
+    r'<malloc version="[^"]+">'
+    r'<heap nr="\d+">'
+    r"<allocated>\d+</allocated>"
+    r"<free>\d+</free>"
+    r"<total>\d+</total>"
+    r"<locked>\d+</locked>"
+    r'<chunks nr="\d+">'
+    r"<used>\d+</used>"
+    r"<free>\d+</free>"
+    r"</chunks>"
+    r"</heap>"
+    r"</malloc>"
+)
+
 
 @pytest.mark.rpc
-def test_get_memory_info(setup_logging, florestad_node):
+def test_get_memory_info(setup_logging, florestad_node_readonly):
     """Test `getmemoryinfo` rpc call."""
     log = setup_logging
     if sys.platform not in ("linux", "darwin"):
@@ -20,7 +35,7 @@ def test_get_memory_info(setup_logging, florestad_node):
         return
 
     log.info("Testing 'getmemoryinfo' rpc call stats")
-    result = florestad_node.rpc.get_memoryinfo("stats")
+    result = florestad_node_readonly.rpc.get_memoryinfo("stats")
     log.info(f"Memory info stats: {result}")
     assert result is not None
     assert isinstance(result, dict)
@@ -33,20 +48,6 @@ def test_get_memory_info(setup_logging, florestad_node):
         assert key in memory_info
         assert value >= 0
 
-    pattern = (
-        r'<malloc version="[^"]+">'
-        r'<heap nr="\d+">'
-        r"<allocated>\d+</allocated>"
-        r"<free>\d+</free>"
-        r"<total>\d+</total>"
-        r"<locked>\d+</locked>"
-        r'<chunks nr="\d+">'
-        r"<used>\d+</used>"
-        r"<free>\d+</free>"
-        r"</chunks>"
-        r"</heap>"
-        r"</malloc>"
-    )
-    result = florestad_node.rpc.get_memoryinfo("mallocinfo")
-
-    assert re.fullmatch(pattern, result)
+    result = florestad_node_readonly.rpc.get_memoryinfo("mallocinfo")
+
+    assert MALLOC_INFO_PATTERN.fullmatch(result)
@@ -7,11 +7,10 @@ Integrate test for the CLI utility that interacts with a Floresta node
 using the `getrawtransaction` RPC method.
 """
 
-import time
 import os
 import pytest
 from test_framework.node import NodeType
-from test_framework.util import compare_fields
+from test_framework.util import compare_fields, run_concurrently
 
 ADDRESS_COINBASE = "bcrt1q4gfcga7jfjmm02zpvrh4ttc5k7lmnq2re52z2y"
 ADDRESS_LEGACY = "n2eoQNSGg7ZWjnbXzdnGDMHZShn3MjaEfR"
@@ -110,7 +109,10 @@ class TestGetRawTransaction:
         ]:
             txid = self.bitcoind.rpc.send_to_address(address, value)
             self.log.info(
-                f"Sent transaction to {address} and value {value} " f"with txid: {txid}"
+                "Sent transaction to %s and value %s with txid: %s",
+                address,
+                value,
+                txid,
             )
             txids.append(txid)
 
@@ -119,11 +121,14 @@ class TestGetRawTransaction:
 
         self.bitcoind.rpc.generate_block_to_address(COINBASE_BLOCKS, ADDRESS_COINBASE)
 
-        self.node_manager.connect_nodes(self.bitcoind, utreexod_node)
-        time.sleep(5)
+        block_count = self.bitcoind.rpc.get_block_count()
 
-        self.node_manager.connect_nodes(self.florestad, utreexod_node)
-        time.sleep(5)
+        # utreexod relays the blocks to florestad as soon as it gets them from
+        # bitcoind, so both connections can be made at once
+        self.node_manager.connect_nodes_parallel(
+            [(self.bitcoind, utreexod_node), (self.florestad, utreexod_node)]
+        )
+        self.node_manager.wait_for_tip(self.florestad, block_count)
 
         self.node_manager.connect_nodes(self.florestad, self.bitcoind)
 
@@ -152,33 +157,36 @@ class TestGetRawTransaction:
         )
         self.log.info(block_range)
         for height in range(initial_block_coinbase_wallet, best_block_height):
-            block_hash = self.bitcoind.rpc.get_blockhash(height)
-
-            block = self.bitcoind.rpc.get_block(block_hash, verbosity=1)
+            block = self.bitcoind.rpc.get_block_by_height(height, verbosity=1)
             coinbase_tx = block["tx"][0]  # Get the coinbase transaction txid
 
             self.compare_getrawtransaction(coinbase_tx)
 
     def compare_getrawtransaction(self, txid):
         """Compare getrawtransaction output between Floresta and Bitcoin Core."""
-        self.log.info(
-            f"Comparing getrawtransaction for txid: {txid} with verbose default (verbose=0)"
+        # Verbose default, verbose level 0 and verbose level 1
+        calls = [
+            ("getrawtransaction", [txid]),
+            ("getrawtransaction", [txid, 0]),
+            ("getrawtransaction", [txid, 1]),
+        ]
+        florestad_txs, bitcoind_txs = run_concurrently(
+            lambda: self.florestad.rpc.batch(calls),
+            lambda: self.bitcoind.rpc.batch(calls),
         )
-        get_raw_tx = self.florestad.rpc.get_raw_transaction(txid)
-        get_raw_tx_bitcoind = self.bitcoind.rpc.get_raw_transaction(txid)
-        assert get_raw_tx == get_raw_tx_bitcoind
 
         self.log.info(
-            f"Comparing getrawtransaction for txid: {txid} with verbose level 0"
+            "Comparing getrawtransaction for txid: %s with verbose default (verbose=0)",
+            txid,
         )
-        get_raw_tx = self.florestad.rpc.get_raw_transaction(txid, verbose=0)
-        get_raw_tx_bitcoind = self.bitcoind.rpc.get_raw_transaction(txid, verbose=0)
-        assert get_raw_tx == get_raw_tx_bitcoind
+        assert florestad_txs[0] == bitcoind_txs[0]
 
         self.log.info(
-            f"Comparing getrawtransaction for txid: {txid} with verbose level 1"
+            "Comparing getrawtransaction for txid: %s with verbose level 0", txid
         )
-        get_raw_tx = self.florestad.rpc.get_raw_transaction(txid, verbose=1)
-        get_raw_tx_bitcoind = self.bitcoind.rpc.get_raw_transaction(txid, verbose=1)
+        assert florestad_txs[1] == bitcoind_txs[1]
 
-        compare_fields(get_raw_tx, get_raw_tx_bitcoind, ignore_fields=IGNORE_FIELDS)
+        self.log.info(
+            "Comparing getrawtransaction for txid: %s with verbose level 1", txid
+        )
+        compare_fields(florestad_txs[2], bitcoind_txs[2], ignore_fields=IGNORE_FIELDS)
@@ -10,9 +10,9 @@ import pytest
 
 
 @pytest.mark.rpc
-def test_get_roots(florestad_node):
+def test_get_roots(florestad_node_readonly):
     """
     Test the `get_roots` RPC method.
     """
-    vec_hashes = florestad_node.rpc.get_roots()
+    vec_hashes = florestad_node_readonly.rpc.get_roots()
     assert len(vec_hashes) == 0
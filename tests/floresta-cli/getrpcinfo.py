@@ -10,11 +10,11 @@ import pytest
 
 
 @pytest.mark.rpc
-def test_get_rpc_info(florestad_node):
+def test_get_rpc_info(florestad_node_readonly):
     """
     Test the `getrpcinfo` RPC call for the `florestad` node.
     """
-    result = florestad_node.rpc.get_rpcinfo()
+    result = florestad_node_readonly.rpc.get_rpcinfo()
     expected_logpath = "/regtest/debug.log"
 
     # Assert the structure of the response
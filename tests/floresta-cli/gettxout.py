@@ -6,8 +6,9 @@ gettxout.py
 This functional test cli utility to interact with a Floresta node with `gettxout` command.
 """
 
+import functools
 import pytest
-from test_framework.util import compare_fields
+from test_framework.util import compare_fields, run_concurrently
 
 IGNORE_FIELDS = ["bestblock", "confirmations"]
 
@@ -27,16 +28,34 @@ def test_get_txout(setup_logging, florestad_bitcoind_utreexod_with_chain, node_m
 
     log.info("Comparing gettxout results between Floresta and Bitcoind...")
     for height in range(2, blocks):
-        block_hash = florestad.rpc.get_blockhash(height)
-        block = florestad.rpc.get_block(block_hash)
-        log.info(f"Comparing gettxout results for {height} block {block_hash}...")
-
-        for tx in block["tx"]:
-            txout_floresta = florestad.rpc.get_txout(tx, vout=0, include_mempool=False)
-
+        block = florestad.rpc.get_block_by_height(height)
+        block_hash = block["hash"]
+        log.info("Comparing gettxout results for %s block %s...", height, block_hash)
+
+        # One request per node for all the outputs of the block
+        calls = [("gettxout", [tx, 0, False]) for tx in block["tx"]]
+        txouts_floresta, txouts_bitcoind = run_concurrently(
+            functools.partial(florestad.rpc.batch, calls),
+            functools.partial(bitcoind.rpc.batch, calls),
+        )
+
+        for tx, txout_floresta, txout_bitcoind in zip(
+            block["tx"], txouts_floresta, txouts_bitcoind
+        ):
             assert txout_floresta is not None, f"Txout for tx {tx} is None in Floresta."
-
-            txout_bitcoind = bitcoind.rpc.get_txout(tx, vout=0, include_mempool=False)
             assert txout_bitcoind is not None, f"Txout for tx {tx} is None in Bitcoind."
 
+        # Regtest blocks hold near identical coinbase outputs, so compare the whole
+        # block at once and only walk the fields when something differs
+        if [strip_fields(txout) for txout in txouts_floresta] == [
+            strip_fields(txout) for txout in txouts_bitcoind
+        ]:
+            continue
+
+        for txout_floresta, txout_bitcoind in zip(txouts_floresta, txouts_bitcoind):
             compare_fields(txout_floresta, txout_bitcoind, ignore_fields=IGNORE_FIELDS)
+
+
+def strip_fields(txout: dict) -> dict:
+    """Return `txout` without the fields that are not compared."""
+    return {key: value for key, value in txout.items() if key not in IGNORE_FIELDS}
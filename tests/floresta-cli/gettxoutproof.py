@@ -38,8 +38,8 @@ class TestGetTxOutProof:
 
         log.info("Testing single-tx blocks with explicit blockhash...")
         for height in range(0, 10):
-            block_hash = florestad.rpc.get_blockhash(height)
-            block = florestad.rpc.get_block(block_hash)
+            block = florestad.rpc.get_block_by_height(height)
+            block_hash = block["hash"]
             txid = block["tx"][0]
 
             proof_floresta = florestad.rpc.get_txout_proof([txid], block_hash)
@@ -60,8 +60,7 @@ class TestGetTxOutProof:
         """gettxoutproof errors when a txid is not in the specified block."""
         log, (florestad, _, _) = setup_nodes
 
-        block_hash_2 = florestad.rpc.get_blockhash(2)
-        block_2 = florestad.rpc.get_block(block_hash_2)
+        block_2 = florestad.rpc.get_block_by_height(2)
         txid_from_block_2 = block_2["tx"][0]
 
         block_hash_3 = florestad.rpc.get_blockhash(3)
@@ -6,8 +6,14 @@ send a ping to bitcoind and check if bitcoind receives it, by calling
 `getpeerinfo` and checking that we've received a ping from floresta.
 """
 
-import time
 import pytest
+from test_framework.util import wait_until
+
+
+def ping_bytes_received(bitcoind) -> int:
+    """Bytes of `ping` messages bitcoind received from its (only) peer."""
+    peer_info = bitcoind.rpc.get_peerinfo()
+    return peer_info[0]["bytesrecv_per_msg"].get("ping", 0)
 
 
 @pytest.mark.rpc
@@ -18,12 +24,14 @@ def test_ping(florestad_bitcoind):
     florestad, bitcoind = florestad_bitcoind
 
     florestad.rpc.ping()
+    wait_until(
+        lambda: ping_bytes_received(bitcoind) > 0,
+        error_msg="bitcoind did not receive the first ping",
+    )
+    first_ping_bytes = ping_bytes_received(bitcoind)
 
-    peer_info = bitcoind.rpc.get_peerinfo()
-    quantity_message = peer_info[0]["bytesrecv_per_msg"].get("ping", 0)
-
-    time.sleep(1)
     florestad.rpc.ping()
-
-    peer_info = bitcoind.rpc.get_peerinfo()
-    assert peer_info[0]["bytesrecv_per_msg"]["ping"], quantity_message * 2
+    wait_until(
+        lambda: ping_bytes_received(bitcoind) > first_ping_bytes,
+        error_msg="bitcoind did not receive the second ping",
+    )
@@ -15,18 +15,20 @@ TIME_TOLERANCE_MARGIN = 2
 
 
 @pytest.mark.rpc
-def test_uptime(florestad_node):
+def test_uptime(florestad_node_readonly):
     """Test uptime of a Floresta node using the rpc."""
 
-    result = florestad_node.rpc.uptime()
-    assert result is not None
-    assert result >= 0
-
-    expected_min_uptime = result + SLEEP_TIME
-    expected_max_uptime = result + SLEEP_TIME + TIME_TOLERANCE_MARGIN
+    start = time.monotonic()
+    first_uptime = florestad_node_readonly.rpc.uptime()
+    assert first_uptime is not None
+    assert first_uptime >= 0
 
     time.sleep(SLEEP_TIME)
 
-    result = florestad_node.rpc.uptime()
+    result = florestad_node_readonly.rpc.uptime()
+    elapsed = time.monotonic() - start
     assert result is not None
-    assert expected_min_uptime <= result <= expected_max_uptime
+
+    # The upper bound is the time that really passed between the two calls,
+    # not the sleep, so a slow RPC round trip doesn't fail the test
+    assert SLEEP_TIME <= result - first_uptime <= elapsed + TIME_TOLERANCE_MARGIN
@@ -8,6 +8,9 @@ import re
 import pytest
 from test_framework.util import assert_bitcoind_service_fields
 
+FLORESTA_SUBVER_PATTERN = re.compile(r"\/Floresta:\d+\.\d+\.\d+.*\/")
+BITCOIND_USER_AGENT_PATTERN = re.compile(r"\/Satoshi:\d*\.\d*\.\d*\/")
+
 
 @pytest.mark.rpc
 def test_node_info(florestad_bitcoind):
@@ -23,7 +26,7 @@ def test_node_info(florestad_bitcoind):
     floresta_peer = peers_seen_by_bitcoind[0]
     assert floresta_peer["services"] == "0000000000001808"  # WITNESS | P2P_V2 | UTREEXO
     assert floresta_peer["version"] == 70016
-    assert re.match(r"\/Floresta:\d+\.\d+\.\d+.*\/", floresta_peer["subver"])
+    assert FLORESTA_SUBVER_PATTERN.match(floresta_peer["subver"])
     assert floresta_peer["inbound"] is True
 
     peers_seen_by_floresta = florestad.rpc.get_peerinfo()
@@ -32,4 +35,4 @@ def test_node_info(florestad_bitcoind):
     assert bitcoind_peer["kind"] == "manual"
     assert_bitcoind_service_fields(bitcoind_peer)
     assert bitcoind_peer["transport_protocol"] == "V2"
-    assert re.match(r"\/Satoshi:\d*\.\d*\.\d*\/", bitcoind_peer["user_agent"])
+    assert BITCOIND_USER_AGENT_PATTERN.match(bitcoind_peer["user_agent"])
@@ -74,4 +74,5 @@ class ChainReorgTest:
         self.log.info(f"Utreexod node mine {blocks} blocks")
         self.utreexod.rpc.generate(blocks)
 
-        self.node_manager.wait_for_sync_nodes(is_finished_ibd=False)
+        height = self.utreexod.rpc.get_block_count()
+        self.node_manager.wait_for_tip(self.florestad, height)
@@ -19,10 +19,15 @@ def test_restart(florestad_node):
     Test restarting a Floresta node and ensuring data directory integrity.
     """
 
+    before_restart = florestad_node.rpc.get_blockchain_info()
+
     florestad_node.stop()
 
     florestad_node.start()
     florestad_node.rpc.wait_on_socket(opened=True)
 
+    # The node reloads its chain from the data directory, no sync is needed
     response = florestad_node.rpc.get_blockchain_info()
     assert response is not None
+    assert response["blocks"] == before_restart["blocks"]
+    assert response["bestblockhash"] == before_restart["bestblockhash"]
@@ -8,6 +8,7 @@ import os
 import pytest
 
 from test_framework.node import NodeType
+from test_framework.util import run_concurrently
 from test_framework.constants import (
     WALLET_ADDRESS,
     WALLET_DESCRIPTOR_EXTERNAL,
@@ -18,41 +19,22 @@ from test_framework.constants import (
     WALLET_XPRIV,
 )
 
-WALLET_CONFIG_ADDRESS = "\n".join(
-    [
-        "[wallet]",
-        f'addresses = [ "{WALLET_ADDRESS}" ]',
-    ]
-)
+WALLET_CONFIG_ADDRESS = f'[wallet]\naddresses = [ "{WALLET_ADDRESS}" ]'.encode()
 
-WALLET_CONFIG_XPUB = "\n".join(
-    [
-        "[wallet]",
-        f'xpubs = [ "{WALLET_XPUB_BIP_84}" ]',
-    ]
-)
+WALLET_CONFIG_XPUB = f'[wallet]\nxpubs = [ "{WALLET_XPUB_BIP_84}" ]'.encode()
 
-WALLET_CONFIG_DESCRIPTOR = "\n".join(
-    [
-        "[wallet]",
-        f'descriptors = [ "{WALLET_DESCRIPTOR_EXTERNAL}", "{WALLET_DESCRIPTOR_INTERNAL}" ]',
-    ]
-)
+WALLET_CONFIG_DESCRIPTOR = (
+    "[wallet]\n"
+    f'descriptors = [ "{WALLET_DESCRIPTOR_EXTERNAL}", "{WALLET_DESCRIPTOR_INTERNAL}" ]'
+).encode()
 
-WALLET_CONFIG_XPRIV = "\n".join(
-    [
-        "[wallet]",
-        f'xpubs = [ "{WALLET_XPRIV}" ]',
-    ]
-)
+WALLET_CONFIG_XPRIV = f'[wallet]\nxpubs = [ "{WALLET_XPRIV}" ]'.encode()
 
-WALLET_CONFIG_DESCRIPTOR_PRIV = "\n".join(
-    [
-        "[wallet]",
-        f'descriptors = [ "{WALLET_DESCRIPTOR_PRIV_EXTERNAL}", '
-        f'"{WALLET_DESCRIPTOR_PRIV_INTERNAL}" ]',
-    ]
-)
+WALLET_CONFIG_DESCRIPTOR_PRIV = (
+    "[wallet]\n"
+    f'descriptors = [ "{WALLET_DESCRIPTOR_PRIV_EXTERNAL}", '
+    f'"{WALLET_DESCRIPTOR_PRIV_INTERNAL}" ]'
+).encode()
 
 EXPECTED_DESCRIPTORS = [
     WALLET_DESCRIPTOR_EXTERNAL,
@@ -68,58 +50,68 @@ def test_wallet_conf(setup_logging, node_manager):
     log = setup_logging
     test = WalletConfigTest(log)
 
-    log.info("Testing wallet configuration with xpub using config files")
-    test.test_valid_config(
-        lambda: create_floresta_node(node_manager, WALLET_CONFIG_XPUB)
+    # The valid configurations don't depend on each other, create and start
+    # their nodes at once
+    xpub_node, descriptor_node, address_node = run_concurrently(
+        lambda: create_floresta_node(node_manager, WALLET_CONFIG_XPUB),
+        lambda: create_floresta_node(node_manager, WALLET_CONFIG_DESCRIPTOR),
+        lambda: create_floresta_node(node_manager, WALLET_CONFIG_ADDRESS),
     )
+    node_manager.run_nodes([xpub_node, descriptor_node, address_node])
+
+    log.info("Testing wallet configuration with xpub using config files")
+    test.test_valid_config(xpub_node)
 
     log.info("Testing wallet configuration with descriptor")
-    test.test_valid_config(
-        lambda: create_floresta_node(node_manager, WALLET_CONFIG_DESCRIPTOR)
-    )
+    test.test_valid_config(descriptor_node)
 
     log.info("Testing wallet configuration with address (no descriptors)")
-    test.test_empty_descriptors(
-        lambda: create_floresta_node(node_manager, WALLET_CONFIG_ADDRESS)
-    )
+    test.test_empty_descriptors(address_node)
 
     log.info("Testing wallet configuration with xpriv (invalid)")
     test.test_invalid_config(
-        lambda: create_floresta_node(node_manager, WALLET_CONFIG_XPRIV)
+        lambda: node_manager.run_node(
+            create_floresta_node(node_manager, WALLET_CONFIG_XPRIV)
+        )
     )
 
     log.info("Testing wallet configuration with private descriptor (invalid)")
     test.test_invalid_config(
-        lambda: create_floresta_node(node_manager, WALLET_CONFIG_DESCRIPTOR_PRIV)
+        lambda: node_manager.run_node(
+            create_floresta_node(node_manager, WALLET_CONFIG_DESCRIPTOR_PRIV)
+        )
     )
 
 
 @pytest.mark.florestad
-def test_wallet_flags(setup_logging, add_node_with_extra_args):
+def test_wallet_flags(setup_logging, node_manager, add_node_with_extra_args):
     """
     Test the wallet configuration flags for the Floresta node.
     """
     log = setup_logging
     test = WalletConfigTest(log)
 
-    log.info("Testing wallet flags with descriptors")
-    test.test_valid_config(
-        lambda: add_node_with_extra_args(
+    # The valid flags don't depend on each other, create and start their nodes at once
+    descriptor_node, xpub_node = run_concurrently(
+        lambda: node_manager.add_node_extra_args(
             variant=NodeType.FLORESTAD,
             extra_args=[
                 f"--wallet-descriptor={WALLET_DESCRIPTOR_EXTERNAL}",
                 f"--wallet-descriptor={WALLET_DESCRIPTOR_INTERNAL}",
             ],
-        )
-    )
-
-    log.info("Testing wallet flags with xpub")
-    test.test_valid_config(
-        lambda: add_node_with_extra_args(
+        ),
+        lambda: node_manager.add_node_extra_args(
             variant=NodeType.FLORESTAD,
             extra_args=[f"--wallet-xpub={WALLET_XPUB_BIP_84}"],
-        )
+        ),
     )
+    node_manager.run_nodes([descriptor_node, xpub_node])
+
+    log.info("Testing wallet flags with descriptors")
+    test.test_valid_config(descriptor_node)
+
+    log.info("Testing wallet flags with xpub")
+    test.test_valid_config(xpub_node)
 
     log.info("Testing wallet flags with xpriv (invalid)")
     test.test_invalid_config(
@@ -143,15 +135,14 @@ def test_wallet_flags(setup_logging, add_node_with_extra_args):
 
 def create_floresta_node(node_manager, config):
     """
-    Create Floresta nodes with the given configuration.
+    Create, without starting it, a Floresta node with the given configuration.
     """
     floresta_node = node_manager.add_node_default_args(variant=NodeType.FLORESTAD)
     config_dir = os.path.join(floresta_node.daemon.data_dir, "config.toml")
-    with open(config_dir, "w", encoding="utf-8") as f:
+    # The configurations are kept as bytes, write them without a text layer
+    with open(config_dir, "wb") as f:
         f.write(config)
-        floresta_node.set_extra_args([f"--config-file={config_dir}"])
-
-    node_manager.run_node(floresta_node)
+    floresta_node.set_extra_args([f"--config-file={config_dir}"])
 
     return floresta_node
 
@@ -166,15 +157,14 @@ class WalletConfigTest:
     def __init__(self, log):
         self.log = log
 
-    def test_valid_config(self, node_creator):
+    def test_valid_config(self, node):
         """
-        Test valid wallet configuration: creates node, validates descriptors,
-        and ensures no duplication on restart.
+        Test valid wallet configuration: validates descriptors and ensures
+        no duplication on restart.
 
         Args:
-            node_creator: Callable that creates and returns a configured node
+            node: Started node with a valid wallet configuration
         """
-        node = node_creator()
         self.validate_wallet_configuration(node)
 
     def test_invalid_config(self, node_creator):
@@ -187,17 +177,14 @@ class WalletConfigTest:
         with pytest.raises(Exception):
             node_creator()
 
-    def test_empty_descriptors(self, node_creator):
+    def test_empty_descriptors(self, node):
         """
         Test configuration that results in no descriptors.
 
         Args:
-            node_creator: Callable that creates a node with no descriptors
+            node: Started node with no descriptors
         """
-        node = node_creator()
-        descriptors = node.rpc.list_descriptors()
-
-        assert len(descriptors) == 0
+        assert node.rpc.list_descriptors() == []
 
     def validate_wallet_configuration(self, node):
         """
@@ -216,8 +203,4 @@ class WalletConfigTest:
         """
         Check the node descriptors against the expected descriptors.
         """
-        descriptors = node.rpc.list_descriptors()
-        assert len(descriptors) == len(EXPECTED_DESCRIPTORS)
-
-        for descriptor, expected in zip(descriptors, EXPECTED_DESCRIPTORS):
-            assert descriptor == expected
+        assert node.rpc.list_descriptors() == EXPECTED_DESCRIPTORS
@@ -13,39 +13,28 @@ The difference is that `florestad` will run under a `cargo run` subprocess, whic
 """
 
 import os
-import re
-import sys
-import copy
-import socket
-import shutil
-import signal
+import functools
 import contextlib
 import subprocess
+import threading
 import time
-from datetime import datetime, timezone
-from enum import Enum
-from typing import Any, Dict, List, Pattern, Tuple, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Optional
 
-from test_framework.crypto.pkcs8 import (
-    create_pkcs8_private_key,
-    create_pkcs8_self_signed_certificate,
-)
 from test_framework.daemon import ConfigP2P
 from test_framework.rpc import ConfigRPC
-from test_framework.electrum import ConfigElectrum, ConfigTls
+from test_framework.electrum import ConfigElectrum
 from test_framework.node import Node, NodeType
-from test_framework.util import Utility, wait_until
-from test_framework.p2p import P2P_SERVICES, P2PInterface, NetworkThread
-from test_framework.messages import (
-    NODE_P2P_V2,
-    CAddress,
-    msg_generic,
-    MAX_PROTOCOL_MESSAGE_LENGTH,
-    MAX_MSG_PER_SECOND,
+from test_framework.util import (
+    Utility,
+    get_xdist_worker,
+    run_concurrently,
+    wait_until,
 )
 
 
-# pylint: disable=too-many-public-methods
+# pylint: disable=too-many-public-methods,too-many-instance-attributes
 class FlorestaTestFramework:
     """
     Base class for a floresta test script. Individual floresta
@@ -79,6 +68,20 @@ class FlorestaTestFramework:
       Electrum services to avoid conflicts during parallel test runs.
     """
 
+    # `_network_thread` is only set once a P2P connection is added
+    __slots__ = (
+        "_test_name",
+        "_nodes",
+        "_nodes_by_index",
+        "_variant_counts",
+        "_nodes_lock",
+        "_log",
+        "_p2p_interface",
+        "_targetdir",
+        "_data_root",
+        "_network_thread",
+    )
+
     def __init__(self, logger, test_name: str):
         """
         Sets test framework defaults.
@@ -87,8 +90,22 @@ class FlorestaTestFramework:
         """
         self._test_name = test_name
         self._nodes = []
+        # Same nodes keyed by their index, for `get_node`
+        self._nodes_by_index: Dict[int, Node] = {}
+        # Nodes added so far per variant, numbers their data directories
+        self._variant_counts: Counter = Counter()
+        # Nodes may be added from several threads, see `create_data_dir_for_daemon`
+        self._nodes_lock = threading.Lock()
         self._log = logger
         self._p2p_interface = []
+        # Resolved once, every node created by this framework shares them
+        tempdir = str(Utility.get_integration_test_dir())
+        self._targetdir = os.path.normpath(os.path.join(tempdir, "binaries"))
+        # Each xdist worker gets its own tree, session-scoped nodes share a name
+        self._data_root = os.path.normpath(
+            os.path.join(tempdir, "data", get_xdist_worker() or "", test_name)
+        )
+        os.makedirs(self._data_root, exist_ok=True)
 
     @property
     def test_name(self) -> str:
@@ -106,14 +123,15 @@ class FlorestaTestFramework:
         """
         Create a data directory for the daemon to be run.
         """
-        tempdir = str(Utility.get_integration_test_dir())
-        path_name = node_type.value.lower() + str(
-            self.count_nodes_by_variant(node_type)
-        )
-        datadir = os.path.normpath(
-            os.path.join(tempdir, "data", self.test_name, path_name)
-        )
-        os.makedirs(datadir, exist_ok=True)
+        with self._nodes_lock:
+            path_name = node_type.value.lower() + str(
+                self.count_nodes_by_variant(node_type)
+            )
+            self._variant_counts[node_type] += 1
+        datadir = os.path.join(self._data_root, path_name)
+        # The parent was created with the framework, only the leaf is missing
+        with contextlib.suppress(FileExistsError):
+            os.mkdir(datadir)
 
         return datadir
 
@@ -121,7 +139,7 @@ class FlorestaTestFramework:
         """
         Count the number of nodes of a given variant.
         """
-        return sum(1 for node in self._nodes if node.variant == variant)
+        return self._variant_counts[variant]
 
     def add_node_default_args(self, variant: NodeType) -> Node:
         """
@@ -157,20 +175,18 @@ class FlorestaTestFramework:
         self, variant: NodeType, extra_args: List[str], tls: bool
     ) -> Node:
 
-        tempdir = str(Utility.get_integration_test_dir())
-        targetdir = os.path.normpath(os.path.join(tempdir, "binaries"))
         data_dir = self.create_data_dir_for_daemon(variant)
 
         node = Node.create_node_default_config(
             variant=variant,
             extra_args=extra_args,
             data_dir=data_dir,
-            targetdir=targetdir,
+            targetdir=self._targetdir,
             tls=tls,
             log=self.log,
         )
 
-        self._nodes.append(node)
+        self._register_node(node)
 
         return node
 
@@ -192,8 +208,6 @@ class FlorestaTestFramework:
         Electrum configurations, as well as any additional arguments.
         The node is added to the framework's list of nodes for testing.
         """
-        tempdir = str(Utility.get_integration_test_dir())
-        targetdir = os.path.normpath(os.path.join(tempdir, "binaries"))
         data_dir = self.create_data_dir_for_daemon(variant)
 
         node = Node(
@@ -202,33 +216,40 @@ class FlorestaTestFramework:
             p2p_config=p2p_config,
             extra_args=extra_args,
             electrum_config=electrum_config,
-            targetdir=targetdir,
+            targetdir=self._targetdir,
             data_dir=data_dir,
             tls=tls,
             log=self.log,
         )
-        self._nodes.append(node)
+        self._register_node(node)
 
         return node
 
+    def _register_node(self, node: Node):
+        """Add a node to the framework, making it available to `get_node`."""
+        with self._nodes_lock:
+            self._nodes_by_index[len(self._nodes)] = node
+            self._nodes.append(node)
+
     def get_node(self, index: int) -> Node:
         """
         Given an index, return a node configuration.
         If the node not exists, raise a IndexError exception.
         """
-        if index < 0 or index >= len(self._nodes):
+        try:
+            return self._nodes_by_index[index]
+        except KeyError as e:
             raise IndexError(
                 f"Node {index} not found. Please run it with add_node_settings"
-            )
-        return self._nodes[index]
+            ) from e
 
     def run_node(self, node: Node):
         """
         Start a node and wait for its RPC server to become available.
 
-        Attempts to start the node up to 3 times, checking if the RPC
-        connection is established. If the node fails to start, it is
-        terminated and retried.
+        Attempts to start the node up to 3 times. A failed start is only
+        retried, with new ports, when one of the node's ports turns out to be
+        taken by another process; any other failure is raised right away.
         """
         for _ in range(3):
             try:
@@ -242,14 +263,27 @@ class FlorestaTestFramework:
             except Exception as e:
                 node.stop()
                 error = e
-                if not node.static_values:
-                    self.log.debug(
-                        f"Node '{node.variant}' failed to start, updating configs"
-                    )
-                    node.update_configs()
+                if node.static_values or not node.has_port_conflict():
+                    break
+
+                self.log.debug(
+                    f"Node '{node.variant}' failed to start on a taken port, "
+                    "updating configs"
+                )
+                node.update_configs()
 
         raise RuntimeError(f"Error starting node '{node.variant}': {error}")
 
+    def run_nodes(self, nodes: List[Node]):
+        """
+        Start several nodes in parallel, see `run_node`. Most of a node
+        startup is spent waiting for its RPC server, so starting them
+        together takes as long as the slowest one.
+        """
+        with ThreadPoolExecutor(max_workers=len(nodes)) as executor:
+            # Consume the results to propagate the first failure, if any
+            list(executor.map(self.run_node, nodes))
+
     def stop_node(self, index: int):
         """
         Stop a node given an index on self._tests.
@@ -261,12 +295,17 @@ class FlorestaTestFramework:
         """
         Stop all nodes.
         """
-        for i in range(len(self._nodes)):
-            self.stop_node(i)
+        for node in self._nodes:
+            node.stop()
+
+        if not hasattr(self, "_network_thread"):
+            return
+
+        # pylint: disable=import-outside-toplevel
+        from test_framework.p2p import NetworkThread
 
         if (
-            hasattr(self, "_network_thread")
-            and NetworkThread.network_event_loop is not None
+            NetworkThread.network_event_loop is not None
             and self._network_thread.is_alive()
         ):
             self._network_thread.close(timeout=10)
@@ -276,6 +315,15 @@ class FlorestaTestFramework:
         """
         Check if two peers are connected/disconnected to each other.
         """
+        return self._check_connection(peer_one, peer_two, is_connected)[0]
+
+    def _check_connection(
+        self, peer_one: Node, peer_two: Node, is_connected: bool
+    ) -> Tuple[bool, Optional[List[dict]], Optional[List[dict]]]:
+        """
+        Same as `check_connection`, also returning the `getpeerinfo` response of
+        each peer used for the check (None for a peer that is not running).
+        """
         peer_one_running = peer_one.daemon.is_running
         peer_two_running = peer_two.daemon.is_running
 
@@ -293,58 +341,67 @@ class FlorestaTestFramework:
         # Send pings to both peers to trigger a peer state update
         self._send_peer_pings(peer_one, peer_two)
 
+        peer_one_info = peer_one.rpc.get_peerinfo() if peer_one_running else None
+        peer_two_info = peer_two.rpc.get_peerinfo() if peer_two_running else None
+
         peer_two_in_peer_one = (
-            peer_one.is_peer_connected(peer_two) if peer_one_running else False
+            peer_one.is_peer_connected(peer_two, peer_one_info)
+            if peer_one_running
+            else False
         )
         peer_one_in_peer_two = (
-            peer_two.is_peer_connected(peer_one) if peer_two_running else False
+            peer_two.is_peer_connected(peer_one, peer_two_info)
+            if peer_two_running
+            else False
+        )
+        self.log.debug(
+            f"Peer one {peer_one.variant} is connected to peer two {peer_two.variant}: "
+            f"{peer_two_in_peer_one}; peer two is connected to peer one: "
+            f"{peer_one_in_peer_two}"
         )
 
-        return (
+        connected = (
             peer_two_in_peer_one == is_connected
             and peer_one_in_peer_two == is_connected
         )
+        return connected, peer_one_info, peer_two_info
 
     def wait_for_peers_connections(
         self, peer_one: Node, peer_two: Node, is_connected: bool = True
-    ):
+    ) -> Tuple[Optional[List[dict]], Optional[List[dict]]]:
         """
         Wait for two peers to connect/disconnect to each other.
+
+        Return the `getpeerinfo` responses of both peers from the last check,
+        None for a peer that is not running, so callers don't need to ask again.
         """
-        attempts = 0
+        peers_info = (None, None)
 
         def check_peers_connection():
-            nonlocal attempts
-
-            if attempts > 10:
-                time.sleep(1)
+            nonlocal peers_info
 
-            attempts += 1
-
-            return self.check_connection(peer_one, peer_two, is_connected)
+            connected, peer_one_info, peer_two_info = self._check_connection(
+                peer_one, peer_two, is_connected
+            )
+            peers_info = (peer_one_info, peer_two_info)
+            return connected
 
-        wait_until(predicate=check_peers_connection)
+        # Peers usually connect within a few checks, back off when they don't so
+        # the pings and `getpeerinfo` calls don't flood the nodes
+        wait_until(predicate=check_peers_connection, max_interval=1.0)
 
         self.log.debug(
             f"Peers {peer_one.variant} and {peer_two.variant} are "
             f"{'connected' if is_connected else 'disconnected'}"
         )
 
-    def _send_peer_pings(self, peer_one: Node, peer_two: Node):
-        """Send pings to both peers and log connection status."""
-        if peer_one.daemon.is_running:
-            peer_one.rpc.ping()
-            self.log.debug(
-                f"Peer one {peer_one.variant} is connected to peer two {peer_two.variant}: "
-                f"{peer_one.is_peer_connected(peer_two)}"
-            )
+        return peers_info
 
-        if peer_two.daemon.is_running:
-            peer_two.rpc.ping()
-            self.log.debug(
-                f"Peer two {peer_two.variant} is connected to peer one {peer_one.variant}: "
-                f"{peer_two.is_peer_connected(peer_one)}"
-            )
+    def _send_peer_pings(self, peer_one: Node, peer_two: Node):
+        """Send pings to both running peers at once."""
+        run_concurrently(
+            *(peer.rpc.ping for peer in (peer_one, peer_two) if peer.daemon.is_running)
+        )
 
     def connect_nodes(
         self,
@@ -356,7 +413,7 @@ class FlorestaTestFramework:
         """
         Connect two peers to each other and verify their connection state.
         """
-        if peer_two.variant == NodeType.FLORESTAD:
+        if peer_two.variant is NodeType.FLORESTAD:
             result = peer_two.connect_node(peer_one, command, v2transport=v2transport)
         else:
             result = peer_one.connect_node(peer_two, command, v2transport=v2transport)
@@ -365,6 +422,21 @@ class FlorestaTestFramework:
 
         self.wait_for_peers_connections(peer_one, peer_two)
 
+    def connect_nodes_parallel(self, pairs: List[Tuple[Node, Node]]):
+        """
+        Connect several pairs of peers at the same time, waiting until every
+        pair is connected. Each connection is mostly spent waiting on RPC
+        calls, so running them in threads costs as much as the slowest one.
+        """
+        with ThreadPoolExecutor(max_workers=len(pairs)) as executor:
+            futures = [
+                executor.submit(self.connect_nodes, peer_one, peer_two)
+                for peer_one, peer_two in pairs
+            ]
+            # Propagate the first failure, if any
+            for future in futures:
+                future.result()
+
     def check_sync_nodes(self, is_finished_ibd: bool = True) -> bool:
         """
         Check if all nodes are synced.
@@ -376,17 +448,26 @@ class FlorestaTestFramework:
         if not self._nodes:
             raise AssertionError("No nodes to check for synchronization")
 
-        expected_block = self._nodes[0].rpc.get_block_count()
-        for node in self._nodes:
-            block_count = node.rpc.get_block_count()
+        def sync_state(node: Node) -> Tuple[int, bool]:
+            # A single `getblockchaininfo` gives both the height and the IBD state.
+            # `headers` is the height `getblockcount` reports, `blocks` is only
+            # the validated one
+            if node.variant is NodeType.FLORESTAD and is_finished_ibd:
+                info = node.rpc.get_blockchain_info()
+                return info["headers"], info["initialblockdownload"]
+            return node.rpc.get_block_count(), False
+
+        # The nodes are independent, ask all of them at the same time
+        states = run_concurrently(
+            *(functools.partial(sync_state, node) for node in self._nodes)
+        )
 
-            if (
-                node.variant == NodeType.FLORESTAD
-                and is_finished_ibd
-                and node.rpc.get_blockchain_info()["initialblockdownload"]
-            ):
+        expected_block = states[0][0]
+        for node, (block_count, in_ibd) in zip(self._nodes, states):
+            if in_ibd:
                 self.log.debug(
-                    f"Node '{node.variant}' has not finished IBD. Block count: {block_count}"
+                    f"Node '{node.variant}' has not finished IBD. "
+                    f"Block count: {block_count}"
                 )
                 return False
 
@@ -411,6 +492,32 @@ class FlorestaTestFramework:
 
         self.log.debug("All nodes are synced")
 
+    def wait_for_tip(self, node: Node, height: int, timeout: float = 30):
+        """
+        Wait until `node` has a chain of at least `height` blocks.
+
+        bitcoind holds a `waitforblockheight` request until the tip moves, so
+        it answers as soon as the block arrives; the other daemons have no
+        such RPC and are polled with `getblockcount`.
+        """
+        if node.variant is NodeType.BITCOIND:
+
+            def reached_height() -> bool:
+                tip = node.rpc.wait_for_block_height(height, timeout=1)
+                return tip["height"] >= height
+
+        else:
+
+            def reached_height() -> bool:
+                return node.rpc.get_block_count() >= height
+
+        wait_until(
+            reached_height,
+            timeout=timeout,
+            error_msg=f"Node '{node.variant}' did not reach height {height}",
+        )
+
+    # pylint: disable=too-many-locals
     def add_p2p_connection(
         self,
         node: Node,
@@ -441,6 +548,11 @@ class FlorestaTestFramework:
             connection_type: Type of connection ("outbound-full-relay", "block-relay-only",
              "addr-fetch", "feeler")
         """
+        # The p2p stack is only needed by the p2p tests, don't load it for every test
+        # pylint: disable=import-outside-toplevel
+        from test_framework.p2p import P2P_SERVICES, NetworkThread
+        from test_framework.messages import NODE_P2P_V2
+
         node_peers = node.rpc.get_connectioncount()
 
         if NetworkThread.network_event_loop is None:
@@ -533,6 +645,9 @@ class FlorestaTestFramework:
         Returns:
             The P2PInterface object
         """
+        # pylint: disable=import-outside-toplevel
+        from test_framework.p2p import P2PInterface
+
         # Create default P2PInterface
         p2p_interface = P2PInterface()
 
@@ -553,6 +668,9 @@ class FlorestaTestFramework:
         """
         Create a message of a given size.
         """
+        # pylint: disable=import-outside-toplevel
+        from test_framework.messages import msg_generic
+
         oversized_payload = b"\x00" * size
 
         # Create a generic message
@@ -562,6 +680,9 @@ class FlorestaTestFramework:
         """
         Create a list of node addresses.
         """
+        # pylint: disable=import-outside-toplevel
+        from test_framework.p2p import P2P_SERVICES
+        from test_framework.messages import CAddress
 
         i2p_addr = "c4gfnttsuwqomiygupdqqqyy5y5emnk5c73hrfvatri67prd7vyq.b32.i2p"
         onion_addr = "nix2iapg23s2g6tog6vmmr2xgywfly5522c27hnp7qwm5qyk73mufvyd.onion"
@@ -12,8 +12,32 @@ GENESIS_BLOCK_HASH = "0f9188f13cb7b2c71f2a335e3a4fc328bf5beb436012afca590b1a1146
 GENESIS_BLOCK_DIFFICULTY_INT = 1
 GENESIS_BLOCK_DIFFICULTY_FLOAT = 4.656542373906925e-10
 GENESIS_BLOCK_LEAF_COUNT = 0
+# Serialized regtest genesis header, as returned by `getblockheader <hash> false`
+GENESIS_BLOCK_HEADER_HEX = (
+    "0100000000000000000000000000000000000000000000000000000000000000"
+    "000000003ba3edfd7a7b12b27ac72c3e67768f617fc81bc3888a51323a9fb8aa"
+    "4b1e5e4adae5494dffff7f2002000000"
+)
+# Fields of the verbose `getblockheader` that do not depend on the rest of the chain
+GENESIS_HEADER = {
+    "hash": GENESIS_BLOCK_HASH,
+    "height": GENESIS_BLOCK_HEIGHT,
+    "version": 1,
+    "versionHex": "00000001",
+    "merkleroot": "4a5e1e4baab89f3a32518a88c31bc87f618f76673e2cc77ab2127b7afdeda33b",
+    "time": 1296688602,
+    "mediantime": 1296688602,
+    "nonce": 2,
+    "bits": "207fffff",
+    "difficulty": GENESIS_BLOCK_DIFFICULTY_FLOAT,
+    "nTx": 1,
+}
 CHAIN_NAME = "regtest"
 FLORESTA_TEMP_DIR = os.getenv("FLORESTA_TEMP_DIR")
+# Number of log records buffered in memory before they are written to the test log file
+FLORESTA_LOG_BUFFER = int(os.getenv("FLORESTA_LOG_BUFFER", "1024"))
+# Level of the test loggers, raise it (e.g. INFO) to skip the RPC debug records
+FLORESTA_LOG_LEVEL = os.getenv("FLORESTA_LOG_LEVEL", "DEBUG").upper()
 
 # Wallets information,
 # Mnemonics = useless ritual arm slow mention dog force almost sudden pulp rude eager
@@ -8,7 +8,6 @@ that can be started in regtest mode.
 """
 
 import os
-import time
 
 from abc import ABC, abstractmethod
 from subprocess import Popen, PIPE
@@ -16,6 +15,7 @@ from typing import List
 from test_framework.rpc import ConfigRPC
 from test_framework.daemon import ConfigP2P
 from test_framework.electrum import ConfigElectrum
+from test_framework.util import get_log_file_path
 
 
 # pylint: disable=too-many-public-methods
@@ -136,10 +136,7 @@ class BaseDaemon(ABC):
 
     def _get_logger_file_path(self) -> str | None:
         """Extract the file path from the logger's file handler"""
-        for handler in self.log.handlers:
-            if hasattr(handler, "baseFilename"):
-                return handler.baseFilename
-        return None
+        return get_log_file_path(self.log)
 
     def settings(self) -> List[str]:
         """Getter for `settings` property"""
@@ -161,13 +158,14 @@ class BaseDaemon(ABC):
         """
         Start the daemon process in regtest mode.
 
-        Validates if the process starts successfully; otherwise, logs the error
-        and terminates the process.
+        Returns as soon as the process is spawned, use `ensure_started` to
+        check that it did not exit while waiting for it to be ready.
         """
         if self.is_running:
             raise RuntimeError(f"Daemon '{self.name}' is already running")
 
-        daemon = os.path.normpath(os.path.join(self.target, self.name))
+        # The framework normalizes the target once, appending the name keeps it so
+        daemon = os.path.join(self.target, self.name)
         if not os.path.exists(daemon):
             raise ValueError(f"Daemon path {daemon} does not exist")
 
@@ -177,25 +175,42 @@ class BaseDaemon(ABC):
         if not log_file_path:
             raise ValueError("Log file path not found")
 
+        # Append, the test log and the other daemons write to the same file
         # pylint: disable=consider-using-with
-        stdout_file = open(os.path.join(log_file_path), "w", encoding="utf-8")
+        stdout_file = open(os.path.join(log_file_path), "a", encoding="utf-8")
         # pylint: disable=consider-using-with
         self.process = Popen(cmd, text=True, stderr=PIPE, stdout=stdout_file)
 
-        # Wait a little to see if the process is running
-        time.sleep(1)
-        if not self.is_running:
-            self.process.terminate()
-            stderr = self.process.stderr.read()
+        self.log.debug(self.log_msg(f"Starting node '{self.name}': {' '.join(cmd)}"))
 
-            self.log.debug(
-                self.log_msg(
-                    f"Failed to start node '{self.name}'. Command: {' '.join(cmd)} "
-                )
-            )
-            raise RuntimeError(f"Failed to start node '{self.name}'. {stderr}")
+    def ensure_started(self):
+        """
+        Raise if the process launched by `start` has already exited, with the
+        error it printed. Meant to be polled while waiting for the daemon to be
+        ready, so a failed startup is reported as soon as it happens.
+        """
+        if self.is_running:
+            return
 
-        self.log.debug(self.log_msg(f"Starting node '{self.name}': {' '.join(cmd)}"))
+        stderr = self.process.stderr.read() if self.process is not None else ""
+        self.log.debug(self.log_msg(f"Failed to start node '{self.name}'"))
+        raise RuntimeError(f"Failed to start node '{self.name}'. {stderr}")
+
+    @property
+    def ports(self) -> List[int]:
+        """
+        Every port the daemon is configured to listen on. Daemons without an
+        Electrum server override it to leave the Electrum ports out.
+        """
+        ports = [
+            self._rpc_config.port,
+            self._p2p_config.port,
+            self._electrum_config.port,
+        ]
+        if self._electrum_config.tls is not None:
+            ports.append(self._electrum_config.tls.port)
+
+        return ports
 
     @abstractmethod
     def get_cmd_network(self) -> List[str]:
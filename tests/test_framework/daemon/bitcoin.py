@@ -59,3 +59,8 @@ class BitcoinDaemon(BaseDaemon):
         Return empty list, because bitcoind doesn't support Electrum.
         """
         return []
+
+    @property
+    def ports(self) -> List[int]:
+        """Every port the daemon listens on, bitcoind has no Electrum server."""
+        return [self._rpc_config.port, self._p2p_config.port]
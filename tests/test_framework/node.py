@@ -21,7 +21,7 @@ from test_framework.rpc.floresta import FlorestaRPC
 from test_framework.rpc.utreexo import UtreexoRPC
 from test_framework.electrum import ConfigElectrum, ConfigTls
 from test_framework.electrum.client import ElectrumClient
-from test_framework.util import Utility
+from test_framework.util import Utility, wait_until
 
 
 class NodeType(Enum):
@@ -98,7 +98,7 @@ class Node:
                     f"Unsupported variant: {variant}. Use 'florestad', 'utreexod' or 'bitcoind'."
                 )
 
-        if variant == NodeType.BITCOIND:
+        if variant is NodeType.BITCOIND:
             electrum = None
         else:
             electrum = ElectrumClient(electrum_config, log=log)
@@ -110,6 +110,7 @@ class Node:
         self._variant = variant
         self._static_values = True
         self._log = log
+        self._startup_blockchain_info: Optional[dict] = None
 
     @classmethod
     def create_node_default_config(
@@ -161,6 +162,13 @@ class Node:
         """
         return self.daemon.p2p_url
 
+    @property
+    def startup_blockchain_info(self) -> Optional[dict]:
+        """
+        Get the `getblockchaininfo` response the node gave when it was last started.
+        """
+        return self._startup_blockchain_info
+
     @property
     def static_values(self) -> bool:
         """
@@ -211,7 +219,7 @@ class Node:
 
         Generates a random port and sets default credentials based on the node variant.
         """
-        if variant == NodeType.FLORESTAD:
+        if variant is NodeType.FLORESTAD:
             user = None
             password = None
         else:
@@ -279,15 +287,36 @@ class Node:
             raise RuntimeError(f"Node '{self.variant}' is already running.")
 
         self.daemon.start()
-        self.rpc.wait_on_socket(opened=True)
 
-        # Test if the node is already responding to RPC calls.
-        self.rpc.get_blockchain_info()
+        # Probe the RPC port often, failing right away if the daemon exits
+        def rpc_ready() -> bool:
+            self.daemon.ensure_started()
+            return self.rpc.is_socket_listening()
+
+        wait_until(
+            rpc_ready,
+            timeout=self.rpc.TIMEOUT,
+            error_msg=f"{self.rpc.address} not open",
+        )
+
+        # Test if the node is already responding to RPC calls, keeping
+        # the response so tests can check the startup state without a new call.
+        self._startup_blockchain_info = self.rpc.get_blockchain_info()
+        # A daemon that lost the bind of its RPC port to another process exits,
+        # while the probe above succeeds on the other process' socket
+        self.daemon.ensure_started()
         # When starting Floresta for the first time, it is ideal to check
         # if the Electrum server is ready to receive requests.
-        if self.variant == NodeType.FLORESTAD and self.static_values is not True:
+        if self.variant is NodeType.FLORESTAD and self.static_values is not True:
             self.electrum.ping()
 
+    def has_port_conflict(self) -> bool:
+        """
+        Check if a port the stopped node binds is taken by another process,
+        the only startup failure that a new configuration can fix.
+        """
+        return any(Utility.is_port_in_use(port) for port in self.daemon.ports)
+
     def stop(self):
         """
         Stop the node.
@@ -303,6 +332,7 @@ class Node:
             self.daemon.process.wait()
             self.rpc.wait_on_socket(opened=False)
 
+        self.rpc.close()
         return response
 
     def connect_node(
@@ -317,7 +347,7 @@ class Node:
                 f"{node.variant} is running: {node.daemon.is_running}"
             )
 
-        if node.variant == NodeType.FLORESTAD:
+        if node.variant is NodeType.FLORESTAD:
             raise ValueError("The p2p port is not configurable in floresta")
 
         self.rpc.addnode(node.p2p_url, method, v2transport=v2transport)
@@ -339,7 +369,7 @@ class Node:
         """
         address = (
             self.p2p_url
-            if self.variant != NodeType.FLORESTAD
+            if self.variant is not NodeType.FLORESTAD
             else None  # The p2p port is not configurable in floresta
         )
         variants = {
@@ -353,9 +383,14 @@ class Node:
 
         return variants[self.variant]
 
-    def is_peer_connected(self, peer: "Node") -> bool:
+    def is_peer_connected(
+        self, peer: "Node", peers_info: Optional[List[dict]] = None
+    ) -> bool:
         """
         Check if the given peer is connected to this node via RPC.
+
+        `peers_info` is a `getpeerinfo` response of this node to use instead of
+        asking the node again.
         """
         keys = {
             NodeType.FLORESTAD: ("user_agent", "address"),
@@ -367,7 +402,8 @@ class Node:
             raise ValueError(f"Unknown peer variant: {self.variant}")
 
         user_agent_key, address_key = keys[self.variant]
-        peers_info = self.rpc.get_peerinfo()
+        if peers_info is None:
+            peers_info = self.rpc.get_peerinfo()
         user_agent, address = peer.get_connection_info()
 
         return any(
@@ -377,7 +413,7 @@ class Node:
                 # The p2p port is not configurable in floresta
                 or address is None
                 # Utreexo nodes use `addrlocal` instead of `addr` to show connection information.
-                or self.variant == NodeType.UTREEXOD
+                or self.variant is NodeType.UTREEXOD
             )
             for peer_info in peers_info
         )
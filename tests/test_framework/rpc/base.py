@@ -8,19 +8,35 @@ Define a base class for making RPC calls to a
 """
 
 import json
+import logging
 import re
 import socket
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote
 
-from requests import post
+from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
 from requests.models import HTTPBasicAuth
 from test_framework.rpc import ConfigRPC
 from test_framework.rpc.exceptions import JSONRPCError
 
+# Drop the whitespace `json.dumps` puts after separators by default
+_JSON_SEPARATORS = (",", ":")
+
+# matches, IPv4, IPv6 and optional ports from 0 to 65535
+_NODE_ADDRESS_PATTERN = re.compile(
+    r"^("
+    r"(?:(?:25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])\.){3}"
+    r"(?:25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])|"
+    r"\[([a-fA-F0-9:]+)\]"
+    r")"
+    r"(:(6553[0-5]|655[0-2][0-9]|65[0-4][0-9]{2}|6[0-4][0-9]{3}|[1-9]?[0-9]{1,4}))?$"
+)
+_BLOCKHASH_PATTERN = re.compile(r"^[a-f0-9]{64}$")
+
 
 # pylint: disable=too-many-public-methods
 class BaseRPC(ABC):
@@ -40,17 +56,37 @@ class BaseRPC(ABC):
     """
 
     TIMEOUT: int = 30  # seconds
+    # Connections kept open to the daemon, enough for the concurrent calls
+    # made with `run_concurrently` to not discard their sockets
+    POOL_MAXSIZE: int = 32
 
     def __init__(self, config: ConfigRPC, log):
         self._config = config
         self._jsonrpc_version: str = self.get_jsonrpc_version()
         self._log = log
+        # Keep the HTTP connection alive between calls instead of opening one per
+        # call, created on the first request, see `session`
+        self._session: Optional[Session] = None
 
     @property
     def log(self):
         """Getter for `log` property"""
         return self._log
 
+    @property
+    def session(self) -> Session:
+        """
+        HTTP session used for every call to the RPC server. It is created on
+        first use and again after `close`, e.g. when the node is restarted.
+        """
+        if self._session is None:
+            self._session = Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.POOL_MAXSIZE)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+
+        return self._session
+
     @property
     def config(self) -> ConfigRPC:
         """Getter for `config` property"""
@@ -129,7 +165,7 @@ class BaseRPC(ABC):
         }
         if params is not None:
             payload["params"] = params
-        request["data"] = json.dumps(payload)
+        request["data"] = json.dumps(payload, separators=_JSON_SEPARATORS)
         return request
 
     def _send_request(self, request_kwargs: Dict[str, Any]) -> Dict[str, Any]:
@@ -137,8 +173,10 @@ class BaseRPC(ABC):
         Execute an HTTP POST and return a normalized response dict:
         {"status_code": int, "body": <parsed JSON>}.
         """
-        response = post(**request_kwargs)
-        return {"status_code": response.status_code, "body": response.json()}
+        response = self.session.post(**request_kwargs)
+        # Parse the raw bytes, `response.json()` decodes them to text first
+        body = json.loads(response.content)
+        return {"status_code": response.status_code, "body": body}
 
     def noraise_request(
         self, method: str, params: List[Any] = None, request_id: str = "test"
@@ -180,10 +218,13 @@ class BaseRPC(ABC):
         The method will return the result of the request or raise
         a JSONRPCError if the request failed.
         """
-        logmsg = BaseRPC.build_log_message(
-            self.address, method, params, self._config.user, self._config.password
-        )
-        self.log.debug(self.log_msg(logmsg))
+        # Building the debug messages is not free, skip it when they are filtered out
+        debug = self.log.isEnabledFor(logging.DEBUG)
+        if debug:
+            logmsg = BaseRPC.build_log_message(
+                self.address, method, params, self._config.user, self._config.password
+            )
+            self.log.debug(self.log_msg(logmsg))
 
         resp = self.noraise_request(method, params)
 
@@ -193,20 +234,68 @@ class BaseRPC(ABC):
             )
             raise HTTPError
 
-        result = resp["body"]
+        result = self._result_or_raise(resp["body"])
+        if debug:
+            self.log.debug(self.log_msg(result))
+        return result
+
+    @staticmethod
+    def _result_or_raise(response: Dict[str, Any]) -> Any:
+        """
+        Return the `result` of a JSON-RPC response or raise a JSONRPCError
+        if it carries an error.
+        """
         # Error could be None or a str
         # If in the future this change,
         # cast the resulted error to str
-        if "error" in result and result["error"] is not None:
+        if "error" in response and response["error"] is not None:
             raise JSONRPCError(
-                data=result["error"] if isinstance(result["error"], str) else None,
-                rpc_id=result["id"],
-                code=result["error"]["code"],
-                message=result["error"]["message"],
+                data=response["error"] if isinstance(response["error"], str) else None,
+                rpc_id=response["id"],
+                code=response["error"]["code"],
+                message=response["error"]["message"],
             )
 
-        self.log.debug(self.log_msg(result["result"]))
-        return result["result"]
+        return response["result"]
+
+    def batch(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """
+        Perform several JSON-RPC calls, given as `(method, params)` pairs, in a
+        single HTTP request (a JSON-RPC batch) and return their results in the
+        same order as `calls`.
+
+        Raise a JSONRPCError for the first call that failed.
+        """
+        if not calls:
+            return []
+
+        payload = [
+            {
+                "jsonrpc": self._jsonrpc_version,
+                "id": request_id,
+                "method": method,
+                "params": params,
+            }
+            for request_id, (method, params) in enumerate(calls)
+        ]
+        request = self._build_request_kwargs()
+        request["data"] = json.dumps(payload, separators=_JSON_SEPARATORS)
+
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
+                self.log_msg(f"POST {self.address} batch of {len(calls)} calls")
+            )
+
+        resp = self._send_request(request)
+        if resp["status_code"] != 200:
+            self.log.error(
+                f"RPC batch failed with status code {resp['status_code']}: {resp['body']}"
+            )
+            raise HTTPError
+
+        # The responses of a batch may come in any order
+        responses = sorted(resp["body"], key=lambda response: response["id"])
+        return [self._result_or_raise(response) for response in responses]
 
     def is_socket_listening(self) -> bool:
         """Check if the socket is listening for connections on the specified port."""
@@ -243,6 +332,12 @@ class BaseRPC(ABC):
             state = "open" if opened else "closed"
             raise TimeoutError(f"{self.address} not {state} after {timeout} seconds")
 
+    def close(self):
+        """Close the HTTP connections kept open to the RPC server."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def get_blockchain_info(self) -> dict:
         """
         Get the blockchain info
@@ -263,17 +358,7 @@ class BaseRPC(ABC):
 
         This will make our node try to connect to this peer.
         """
-        # matches, IPv4, IPv6 and optional ports from 0 to 65535
-        pattern = re.compile(
-            r"^("
-            r"(?:(?:25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])\.){3}"
-            r"(?:25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])|"
-            r"\[([a-fA-F0-9:]+)\]"
-            r")"
-            r"(:(6553[0-5]|655[0-2][0-9]|65[0-4][0-9]{2}|6[0-4][0-9]{3}|[1-9]?[0-9]{1,4}))?$"
-        )
-
-        if not pattern.match(node):
+        if not _NODE_ADDRESS_PATTERN.match(node):
             raise ValueError("Invalid ip[:port] format")
 
         if command not in ("add", "remove", "onetry"):
@@ -310,7 +395,7 @@ class BaseRPC(ABC):
         """
         Get the header of a block
         """
-        if not bool(re.fullmatch(r"^[a-f0-9]{64}$", blockhash)):
+        if not _BLOCKHASH_PATTERN.fullmatch(blockhash):
             raise ValueError(f"Invalid blockhash '{blockhash}'.")
 
         params = [blockhash]
@@ -348,6 +433,15 @@ class BaseRPC(ABC):
 
         return self.perform_request("getblock", params=[blockhash, verbosity])
 
+    def get_block_by_height(self, height: int, verbosity: int = 1):
+        """
+        Get the block at a given height of the main chain, with `get_block`.
+
+        Both the `getblockhash` and the `getblock` requests are always sent, since
+        the block at a height can change after a reorg.
+        """
+        return self.get_block(self.get_blockhash(height), verbosity)
+
     def get_peerinfo(self):
         """
         Get the peer information
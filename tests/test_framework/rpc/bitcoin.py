@@ -33,6 +33,23 @@ class BitcoinRPC(BaseRPC):
         """
         return self.perform_request("generatetoaddress", params=[nblocks, address])
 
+    def wait_for_block_height(self, height: int, timeout: float) -> dict:
+        """
+        Block, on the server side, until the node reaches the given height
+        by using `waitforblockheight`
+
+        Args:
+            height: The block height to wait for
+            timeout: How long, in seconds, the node may hold the request. Keep it
+                below `TIMEOUT`, or the HTTP request times out first
+
+        Returns:
+            A dict with the `hash` and `height` of the tip when the call returned
+        """
+        return self.perform_request(
+            "waitforblockheight", params=[height, int(timeout * 1000)]
+        )
+
     def verify_txout_proof(self, proof: str) -> list:
         """
         Verify a Merkle proof returned by `gettxoutproof`.
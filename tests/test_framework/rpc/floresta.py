@@ -6,6 +6,8 @@ floresta_rpc.py
 A test framework for testing JsonRPC calls to a floresta node.
 """
 
+from typing import Any, List, Tuple
+
 from test_framework.rpc.base import BaseRPC
 
 
@@ -20,6 +22,15 @@ class FlorestaRPC(BaseRPC):
         """
         return "2.0"
 
+    def batch(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """
+        Perform the `(method, params)` calls and return their results in order.
+
+        florestad's JSON-RPC server takes a single request per HTTP call, so
+        the calls are sent one after the other instead of as a batch.
+        """
+        return [self.perform_request(method, params) for method, params in calls]
+
     def get_roots(self):
         """
         Returns the roots of our current floresta state performing
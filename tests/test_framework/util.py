@@ -4,16 +4,21 @@
 
 import os
 import time
+import functools
+import logging
 import inspect
 import random
 import socket
 import subprocess
+import threading
 import math
+from concurrent.futures import ThreadPoolExecutor
 
-from test_framework.crypto.pkcs8 import (
-    create_pkcs8_private_key,
-    create_pkcs8_self_signed_certificate,
-)
+# Ports already handed out by `get_available_random_port_by_range` in this
+# process (one per xdist worker). Nodes are created before any of them starts,
+# so probing alone could give the same free port to two of them
+_ALLOCATED_PORTS: set[int] = set()
+_ALLOCATED_PORTS_LOCK = threading.Lock()
 
 SERVICE_FLAGS_BY_NAME = {
     "NETWORK": 1 << 0,
@@ -70,38 +75,75 @@ class Utility:
 
         return git_describe
 
+    @staticmethod
+    def is_port_in_use(port: int) -> bool:
+        """Check if something is listening on the given local port"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            return s.connect_ex(("127.0.0.1", port)) == 0
+
     @staticmethod
     def get_available_random_port_by_range(start: int, end: int):
-        """Get an available random port in the range [start, end]"""
-        while True:
-            port = random.randint(start, end)
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                # Check if the port is available
-                if s.connect_ex(("127.0.0.1", port)) != 0:
-                    return port
+        """
+        Get an available random port in the range [start, end], never returning
+        the same port twice in a process
+        """
+        with _ALLOCATED_PORTS_LOCK:
+            while True:
+                port = random.randint(start, end)
+                if port in _ALLOCATED_PORTS or Utility.is_port_in_use(port):
+                    continue
+
+                _ALLOCATED_PORTS.add(port)
+                return port
 
     @staticmethod
     def get_random_port():
-        """Get a random port in the range [2000, 65535]"""
-        return Utility.get_available_random_port_by_range(2000, 65535)
+        """
+        Get a random port in the range [2000, 65535]. Under pytest-xdist every
+        worker draws from its own slice of the range, so two workers starting
+        daemons at the same time never pick the same free port.
+        """
+        start, end = 2000, 65535
+        worker = get_xdist_worker()
+        worker_count = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+        if worker is not None and worker_count > 1:
+            size = (end - start + 1) // worker_count
+            start += int(worker.removeprefix("gw")) * size
+            end = start + size - 1
+
+        return Utility.get_available_random_port_by_range(start, end)
 
     @staticmethod
+    @functools.cache
     def create_tls_key_cert() -> tuple[str, str]:
         """
         Create a PKCS#8 formatted private key and a self-signed certificate.
         These keys are intended to be used with florestad's --tls-key-path and --tls-cert-path
         options.
+
+        The files are always written to the same place for a given process (xdist
+        worker), so they are generated once and shared by its TLS nodes.
         """
         # If we're in CI, we need to use the
         # path to the integration test dir
         # tempfile will be used to get the proper
         # temp dir for the OS
-        tls_rel_path = os.path.join(Utility.get_integration_test_dir(), "data", "tls")
+        # Each xdist worker writes its own files, like it does with the data dirs
+        tls_rel_path = os.path.join(
+            Utility.get_integration_test_dir(), "data", get_xdist_worker() or "", "tls"
+        )
         tls_path = os.path.normpath(os.path.abspath(tls_rel_path))
 
         # Create the folder if not exists
         os.makedirs(tls_path, exist_ok=True)
 
+        # Only the TLS tests need `cryptography`, don't import it for the others
+        # pylint: disable=import-outside-toplevel
+        from test_framework.crypto.pkcs8 import (
+            create_pkcs8_private_key,
+            create_pkcs8_self_signed_certificate,
+        )
+
         # Create certificates
         pk_path, private_key = create_pkcs8_private_key(tls_path)
 
@@ -112,6 +154,48 @@ class Utility:
         return (pk_path, cert_path)
 
 
+def get_xdist_worker() -> str | None:
+    """Name of the pytest-xdist worker running the tests (e.g. "gw0"), if any."""
+    return os.getenv("PYTEST_XDIST_WORKER")
+
+
+def get_log_file_path(logger: logging.Logger) -> str | None:
+    """
+    Get the file written by `logger`. Buffering handlers are followed through
+    their `target`, and child loggers through the handlers of their ancestors.
+    """
+    current = logger
+    while current is not None:
+        for handler in current.handlers:
+            while not hasattr(handler, "baseFilename") and hasattr(handler, "target"):
+                handler = handler.target
+            if hasattr(handler, "baseFilename"):
+                return handler.baseFilename
+        current = current.parent if current.propagate else None
+
+    return None
+
+
+# Shared by every `run_concurrently` call, so the per transaction comparisons
+# don't spawn new threads each time
+_CONCURRENT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="run_concurrently"
+)
+
+
+def run_concurrently(*funcs):
+    """
+    Call the given functions on a shared thread pool and return their results
+    in the same order. Meant for independent RPC calls to different nodes,
+    which mostly wait on the network. The first raised exception is propagated.
+
+    The functions must not call `run_concurrently` themselves, since the pool
+    is bounded and nested calls may wait on each other.
+    """
+    futures = [_CONCURRENT_EXECUTOR.submit(func) for func in funcs]
+    return [future.result() for future in futures]
+
+
 def wait_until_helper_internal(
     predicate, *, timeout=60, lock=None, timeout_factor=1.0, check_interval=0.05
 ):
@@ -144,15 +228,28 @@ def wait_until_helper_internal(
     )
 
 
-def wait_until(predicate, timeout=30, interval=0.5, error_msg="Condition not met"):
+def wait_until(
+    predicate,
+    timeout=30,
+    interval=0.05,
+    error_msg="Condition not met",
+    max_interval=None,
+):
     """
     Wait until a predicate returns True or timeout is reached.
+
+    The predicate is polled every `interval` seconds, so the wait ends at most
+    `interval` after the condition is met. With `max_interval`, the interval
+    grows by half after each failed check up to that value, for predicates
+    that are expensive to check but usually become true quickly.
     """
-    start = time.time()
-    while time.time() - start < timeout:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
         if predicate():
             return True
         time.sleep(interval)
+        if max_interval is not None:
+            interval = min(interval * 1.5, max_interval)
 
     raise TimeoutError(f"{error_msg} after {timeout} seconds")
 
@@ -196,6 +293,10 @@ def compare_fields(candidate, reference, ignore_fields=None, float_tol=1e-8):
         For Floresta RPC tests, use Floresta as `candidate` and the reference
         node as `reference`.
     """
+    # Equal structures always pass, compare them in one go before walking them
+    if candidate == reference:
+        return
+
     if ignore_fields is None:
         ignore_fields = set()
     elif isinstance(ignore_fields, list):